@@ -0,0 +1,84 @@
+"""
+Per-item cost of carrying evidence through a run: the previous path (pydantic
+models end to end, VerdictReport validation, model_dump + json.dump for both
+evidence.json and final_report.json) against the slotted EvidenceRecord path
+with a single pydantic JSON dump per artifact.
+
+    python -m benchmarks.evidence_overhead --items 5000
+"""
+import argparse
+import json
+import time
+from uuid import uuid4
+
+from src.orchestrator.evidence_buffer import dump_evidence_json, to_records
+from src.schemas.evidence import Evidence
+from src.schemas.plan import ResearchPlan
+from src.schemas.report import Signals, Verdict, VerdictReport
+from src.schemas.request import RequestInput
+
+def _crew_output(n: int):
+    return [
+        Evidence(
+            id=str(uuid4()),
+            source_type="news",
+            source_ref="mock_news_api",
+            claim=f"Claim number {i} about TSLA",
+            confidence=0.8,
+            raw_snippet="snippet " * 8,
+            tags=["sentiment", "risk"],
+        )
+        for i in range(n)
+    ]
+
+def _report_kwargs():
+    return dict(
+        request=RequestInput(ticker="TSLA", horizon="1m", risk_profile="normal"),
+        signals=Signals(),
+        research_plan=ResearchPlan(tasks=[]),
+        verdict=Verdict.HOLD,
+        rationale={"bull_case": "-", "bear_case": "-"},
+        risks=[],
+        next_actions=[],
+    )
+
+def baseline(evidences):
+    evidence_json = json.dumps([e.model_dump() for e in evidences], indent=2, default=str)
+    report = VerdictReport(evidence=evidences, **_report_kwargs())
+    report_json = json.dumps(report.model_dump(), indent=2, default=str)
+    return len(evidence_json) + len(report_json)
+
+def records_path(evidences):
+    records = to_records(evidences)
+    evidence_json = dump_evidence_json(records)
+    report = VerdictReport.model_construct(evidence=[r.to_model() for r in records], **_report_kwargs())
+    report_json = report.model_dump_json(indent=2)
+    return len(evidence_json) + len(report_json)
+
+def _time(fn, evidences, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(evidences)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    evidences = _crew_output(args.items)
+    old = _time(baseline, evidences, args.repeat)
+    new = _time(records_path, evidences, args.repeat)
+
+    per_old = old / args.items * 1e6
+    per_new = new / args.items * 1e6
+    print(f"items: {args.items}")
+    print(f"pydantic models + model_dump: {per_old:8.2f} us/item")
+    print(f"EvidenceRecord + dump_json:   {per_new:8.2f} us/item")
+    print(f"reduction:                    {(1 - per_new / per_old):8.1%}")
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,108 @@
+import logging
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+
 from .orchestrator.flow import OrchestratorFlow
+from .tools.task_queue import DONE, TaskQueue, make_queue
+from .utils.config import load_config
+from .utils.io import ensure_dir, read_json, write_json
+from .utils.profiling import PROFILE_DIR, aggregate_profiles
+
+logger = logging.getLogger(__name__)
+
+def open_queue() -> TaskQueue:
+    execution = load_config("execution")
+    return make_queue(
+        execution.get("queue_backend", "sqlite"),
+        execution.get("queue_path", "data/queue.db"),
+        max_attempts=execution.get("queue_max_attempts", 3),
+        shared_filesystem=execution.get("queue_shared_filesystem", False),
+    )
 
-def run_research(ticker: str, horizon: str = "1m", risk_profile: str = "normal"):
-    flow = OrchestratorFlow()
+def run_research(ticker: str, horizon: str = "1m", risk_profile: str = "normal", early_decision: bool = False,
+                 deadline_seconds: Optional[float] = None, distributed: bool = False, profile: bool = False):
+    queue = open_queue() if distributed else None
+    flow = OrchestratorFlow(early_decision=early_decision, deadline_seconds=deadline_seconds, queue=queue, profile=profile)
     return flow.run(ticker, horizon, risk_profile)
+
+def resume_research(run_id: str, early_decision: bool = False, deadline_seconds: Optional[float] = None,
+                    distributed: bool = False, profile: bool = False):
+    queue = open_queue() if distributed else None
+    flow = OrchestratorFlow(early_decision=early_decision, deadline_seconds=deadline_seconds, queue=queue, profile=profile)
+    return flow.resume(run_id)
+
+def run_batch(tickers: List[str], horizon: str = "1m", risk_profile: str = "normal", distributed: bool = False,
+              timeout: Optional[float] = None, resume: Optional[str] = None, profile: bool = False) -> str:
+    """
+    Researches every ticker and writes a batch.json manifest with the status and
+    run directory of each. In distributed mode whole requests are queued and
+    served by workers; otherwise tickers run one after another in-process.
+
+    With `resume` (a batch id or directory), only the tickers that failed or
+    finished partially (some crew tasks failed or timed out) in that batch are retried, each continuing from its own checkpoints.
+
+    With `profile`, every run is profiled and the profiles are summed into
+    <batch_dir>/profile.
+    """
+    storage = load_config("storage")
+    runs_dir = storage.get("runs_dir", "runs")
+    reports_dir = storage.get("reports_dir", "reports")
+    if resume:
+        batch_dir = resume if os.path.isdir(resume) else os.path.join(reports_dir, resume)
+        manifest = read_json(os.path.join(batch_dir, "batch.json"))
+        horizon, risk_profile = manifest["horizon"], manifest["risk_profile"]
+        results: Dict[str, Dict] = manifest["tickers"]
+        todo = {ticker: entry["run_id"] for ticker, entry in results.items() if entry["status"] != "done"}
+        logger.info(f"Resuming batch {manifest['batch_id']}: retrying {len(todo)} of {len(results)} tickers")
+    else:
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        batch_dir = os.path.join(reports_dir, f"batch_{stamp}")
+        manifest = {"batch_id": f"batch_{stamp}", "horizon": horizon, "risk_profile": risk_profile}
+        results = {}
+        # Run ids are fixed up front so a retry can find the checkpoints of a failed attempt
+        todo = {ticker: f"{stamp}_{ticker}" for ticker in tickers}
+    ensure_dir(batch_dir)
+
+    if distributed:
+        queue = open_queue()
+        job_ids = {
+            ticker: queue.enqueue("request", {"ticker": ticker, "horizon": horizon, "risk_profile": risk_profile, "run_id": run_id, "profile": profile})
+            for ticker, run_id in todo.items()
+        }
+        jobs = queue.wait(list(job_ids.values()), timeout=timeout, poll_seconds=0.5)
+        for ticker, job_id in job_ids.items():
+            job = jobs.get(job_id)
+            entry = {"run_id": todo[ticker], "run_dir": os.path.join(runs_dir, todo[ticker]), "job_id": job_id}
+            if job is not None and job.status == DONE:
+                missed = job.result.get("failed_tasks", []) + job.result.get("timed_out_tasks", [])
+                results[ticker] = {**entry, **_run_status(missed), "run_dir": job.result["run_dir"]}
+            else:
+                if job is None:
+                    # Abandoned requests are cancelled; --resume queues them again
+                    queue.cancel(job_id)
+                error = job.error if job is not None else "timed out waiting for a worker"
+                results[ticker] = {**entry, "status": "failed", "error": error}
+    else:
+        flow = OrchestratorFlow(profile=profile)
+        for ticker, run_id in todo.items():
+            entry = {"run_id": run_id, "run_dir": os.path.join(runs_dir, run_id)}
+            try:
+                run_dir = flow.run_or_resume(ticker, horizon, risk_profile, run_id)
+                results[ticker] = {**entry, **_run_status(flow.failed_tasks + flow.timed_out_tasks), "run_dir": run_dir}
+            except Exception as e:
+                logger.error(f"Research for {ticker} failed: {e}")
+                results[ticker] = {**entry, "status": "failed", "error": repr(e)}
+
+    write_json(os.path.join(batch_dir, "batch.json"), {**manifest, "distributed": distributed, "tickers": results})
+    if profile:
+        aggregate_profiles([entry["run_dir"] for entry in results.values()], os.path.join(batch_dir, PROFILE_DIR))
+    failed = sum(1 for r in results.values() if r["status"] != "done")
+    logger.info(f"Batch {manifest['batch_id']}: {len(results) - failed} done, {failed} failed or partial. Manifest: {batch_dir}/batch.json")
+    return batch_dir
+
+def _run_status(missed_tasks: List[str]) -> Dict:
+    # A run that completed without some of its tasks is retried by --resume like a failed one
+    if missed_tasks:
+        return {"status": "partial", "error": f"tasks failed or timed out: {', '.join(missed_tasks)}"}
+    return {"status": "done", "error": None}
@@ -1,26 +1,188 @@
 import typer
-from .app import run_research
+from typing import Optional
+from .app import resume_research, run_batch, run_research
 from .utils.logging import setup_logging
 
 app = typer.Typer()
 
-@app.command()
+@app.callback(invoke_without_command=True)
 def main(
-    ticker: str = typer.Option(..., help="Stock ticker symbol (e.g. TSLA)"),
+    ctx: typer.Context,
+    ticker: Optional[str] = typer.Option(None, help="Stock ticker symbol (e.g. TSLA)"),
     horizon: str = typer.Option("1m", help="Investment horizon (1w, 1m, 3m, 1y)"),
     risk: str = typer.Option("normal", help="Risk profile (conservative, normal, aggressive)"),
+    early_decision: bool = typer.Option(False, help="Stop once remaining tasks can no longer change the verdict label"),
+    deadline: Optional[float] = typer.Option(None, help="Run deadline in seconds (overrides configs/execution.yaml)"),
+    distributed: bool = typer.Option(False, help="Dispatch crew tasks to `worker` processes through the task queue"),
+    profile: bool = typer.Option(False, help="Write per-stage and per-crew CPU/allocation profiles into the run directory"),
 ):
     """
     Run the Market Research Orchestrator for a given ticker.
     """
     setup_logging()
+    if ctx.invoked_subcommand is not None:
+        return
+    if ticker is None:
+        raise typer.BadParameter("Missing option '--ticker'.", param_hint="--ticker")
+
     typer.echo(f"Starting research for {ticker}...")
     try:
-        result_path = run_research(ticker, horizon, risk)
+        result_path = run_research(ticker, horizon, risk, early_decision=early_decision, deadline_seconds=deadline,
+                                   distributed=distributed, profile=profile)
         typer.echo(f"Research complete! Results saved in: {result_path}")
     except Exception as e:
         typer.echo(f"Error occurred: {e}", err=True)
         raise e
 
+@app.command()
+def replay(
+    runs_dir: str = typer.Option("runs", help="Directory containing stored runs"),
+    output: str = typer.Option("reports/replay/replay_results.csv", help="Path of the results table (CSV)"),
+    workers: Optional[int] = typer.Option(None, help="Worker processes (defaults to CPU count)"),
+):
+    """
+    Re-score stored runs with the current Synthesizer and VerdictEngine.
+    """
+    from .orchestrator.replay import replay_runs
+
+    summary = replay_runs(runs_dir, output, workers=workers)
+    typer.echo(f"Replayed {summary['runs']} runs, {summary['changed']} verdicts changed, {summary['failed']} failed.")
+    for transition, count in sorted(summary["transitions"].items()):
+        typer.echo(f"  {transition}: {count}")
+    typer.echo(f"Results saved in: {summary['output']}")
+
+@app.command()
+def backtest(
+    tickers: str = typer.Option(..., help="Comma-separated tickers (e.g. TSLA,AAPL)"),
+    days: int = typer.Option(1260, help="Days of history per ticker"),
+    horizon: str = typer.Option("1m", help="Forward-return horizon (1w, 1m, 3m, 1y)"),
+    step: int = typer.Option(1, help="Evaluate every N-th trading day"),
+    workers: int = typer.Option(1, help="Worker processes"),
+    output: str = typer.Option("reports/backtest/backtest_results.csv", help="Path of the per-snapshot table (CSV)"),
+):
+    """
+    Backtest verdicts against forward returns over historical snapshots.
+    """
+    from .orchestrator.backtest import Backtester
+
+    symbols = [t.strip() for t in tickers.split(",") if t.strip()]
+    summary = Backtester(horizon=horizon).run(symbols, days, step=step, workers=workers, output_path=output)
+    typer.echo(f"Backtested {summary['snapshots']} snapshots over {summary['tickers']} tickers ({horizon} horizon).")
+    for label, stats in summary["by_verdict"].items():
+        typer.echo(f"  {label}: n={stats['count']} hit_rate={stats['hit_rate']:.2%} mean_fwd={stats['mean_forward_return']:+.2%}")
+    typer.echo(f"Results saved in: {output}")
+
+@app.command()
+def ingest(
+    prices: Optional[str] = typer.Option(None, help="CSV of OHLCV bars (ticker,date,open,high,low,close,volume)"),
+    news: Optional[str] = typer.Option(None, help="JSONL of articles carrying ticker and date"),
+    data_dir: str = typer.Option("data/local", help="Root of the local data provider files"),
+):
+    """
+    Build memory-mapped bar files and the indexed news corpus for the local data provider.
+    """
+    from .tools.local_data import ingest_news_jsonl, ingest_prices_csv
+
+    if prices:
+        counts = ingest_prices_csv(prices, data_dir)
+        typer.echo(f"Ingested bars for {len(counts)} tickers ({sum(counts.values())} bars stored).")
+    if news:
+        counts = ingest_news_jsonl(news, data_dir)
+        typer.echo(f"Ingested news for {len(counts)} tickers ({sum(counts.values())} articles stored).")
+
+@app.command()
+def resume(
+    run_id: str = typer.Argument(..., help="Run id under runs/ (or a run directory) to continue"),
+    early_decision: bool = typer.Option(False, help="Stop once remaining tasks can no longer change the verdict label"),
+    deadline: Optional[float] = typer.Option(None, help="Run deadline in seconds (overrides configs/execution.yaml)"),
+    distributed: bool = typer.Option(False, help="Dispatch remaining crew tasks to `worker` processes"),
+    profile: bool = typer.Option(False, help="Profile the resumed stages and crews"),
+):
+    """
+    Resume an interrupted run from its checkpoints, skipping finished tasks.
+    """
+    result_path = resume_research(run_id, early_decision=early_decision, deadline_seconds=deadline, distributed=distributed,
+                                  profile=profile)
+    typer.echo(f"Research complete! Results saved in: {result_path}")
+
+@app.command()
+def batch(
+    tickers: Optional[str] = typer.Option(None, help="Comma-separated tickers (e.g. TSLA,AAPL)"),
+    horizon: str = typer.Option("1m", help="Investment horizon (1w, 1m, 3m, 1y)"),
+    risk: str = typer.Option("normal", help="Risk profile (conservative, normal, aggressive)"),
+    distributed: bool = typer.Option(False, help="Queue one request per ticker for `worker` processes"),
+    timeout: Optional[float] = typer.Option(None, help="Seconds to wait for distributed requests"),
+    resume: Optional[str] = typer.Option(None, help="Batch id (or directory) whose failed tickers should be resumed"),
+    profile: bool = typer.Option(False, help="Profile every run and aggregate the profiles in the batch directory"),
+):
+    """
+    Research several tickers and write a batch.json manifest.
+    """
+    if tickers is None and resume is None:
+        raise typer.BadParameter("Missing option '--tickers'.", param_hint="--tickers")
+    symbols = [t.strip() for t in (tickers or "").split(",") if t.strip()]
+    batch_dir = run_batch(symbols, horizon, risk, distributed=distributed, timeout=timeout, resume=resume, profile=profile)
+    typer.echo(f"Batch complete! Manifest saved in: {batch_dir}/batch.json")
+
+@app.command()
+def worker(
+    max_jobs: Optional[int] = typer.Option(None, help="Exit after this many jobs"),
+    idle_exit: Optional[float] = typer.Option(None, help="Exit after this many idle seconds"),
+):
+    """
+    Serve queued tasks and requests (run one per process; other hosts need queue_shared_filesystem).
+    """
+    from .app import open_queue
+    from .orchestrator.worker import Worker
+    from .utils.config import load_config
+
+    execution = load_config("execution")
+    node = Worker(
+        open_queue(),
+        lease_seconds=execution.get("queue_lease_seconds", 30),
+        heartbeat_seconds=execution.get("queue_heartbeat_seconds", 10),
+    )
+    typer.echo(f"Worker {node.worker_id} polling for jobs...")
+    processed = node.run(max_jobs=max_jobs, idle_exit_seconds=idle_exit)
+    typer.echo(f"Worker {node.worker_id} processed {processed} jobs.")
+
+@app.command()
+def watch(
+    tickers: Optional[str] = typer.Option(None, help="Comma-separated tickers for the mock stream"),
+    source: str = typer.Option("mock", help="Stream source: mock or file"),
+    path: Optional[str] = typer.Option(None, help="JSONL file to tail when --source file"),
+    follow: bool = typer.Option(True, help="Keep tailing the file for new lines"),
+    ticks: int = typer.Option(250, help="Bars per ticker emitted by the mock stream"),
+    max_events: Optional[int] = typer.Option(None, help="Stop after this many stream events"),
+):
+    """
+    Watch a stream of bars and news, launching targeted crews when a trigger fires.
+    """
+    from .orchestrator.watch import WatchEngine
+    from .tools.streams import FileTailSource, MockStreamSource
+
+    if source == "file":
+        if path is None:
+            raise typer.BadParameter("--path is required for --source file.", param_hint="--path")
+        stream = FileTailSource(path, follow=follow)
+    elif source == "mock":
+        if not tickers:
+            raise typer.BadParameter("--tickers is required for --source mock.", param_hint="--tickers")
+        stream = MockStreamSource([t.strip() for t in tickers.split(",") if t.strip()], ticks=ticks)
+    else:
+        raise typer.BadParameter(f"Unknown stream source: {source}", param_hint="--source")
+
+    typer.echo("Watching stream (Ctrl+C to stop)...")
+    engine = WatchEngine()
+    try:
+        summary = engine.run(stream, max_events=max_events)
+    except KeyboardInterrupt:
+        stream.close()
+        typer.echo("Stopped.")
+        return
+    typer.echo(f"Processed {summary['events']} events over {summary['tickers']} tickers; "
+               f"launched {summary['tasks_launched']} tasks ({summary['tasks_failed']} failed).")
+    typer.echo(f"Events saved in: {summary['watch_dir']}/events.jsonl")
+
 if __name__ == "__main__":
     app()
@@ -1,9 +1,12 @@
+from typing import Dict, List
 from src.schemas.evidence import Evidence
 from uuid import uuid4
 
 class DebateCrew:
     def execute(self, inputs: dict) -> list[Evidence]:
         ticker = inputs.get("ticker", "UNKNOWN")
+        context = inputs.get("context") or {}
+        prompt = self.render_prompt(ticker, context)
         
         evidences = []
         evidences.append(Evidence(
@@ -12,7 +15,20 @@ class DebateCrew:
             source_ref="debate_session",
             claim=f"After debating bull/bear cases for {ticker}, the bear case regarding regulatory risk is deemed more significant.",
             confidence=0.6,
+            raw_snippet=prompt if context else None,
             tags=["debate", "verdict"]
         ))
         
         return evidences
+
+    @staticmethod
+    def render_prompt(ticker: str, context: Dict[str, List[dict]]) -> str:
+        """
+        Debate prompt over the retrieved bull/bear evidence; its size is bounded by the retriever.
+        """
+        lines = [f"Debate the bull and bear cases for {ticker} using only the evidence below."]
+        for side in ("bull", "bear"):
+            lines.append(f"{side.title()} evidence:")
+            for item in context.get(side, []):
+                lines.append(f"- [{item['id'][:6]}] {item['claim']} (Conf: {item['confidence']})")
+        return "\n".join(lines)
@@ -1,25 +1,69 @@
+from datetime import datetime
+from typing import Optional
 from src.schemas.evidence import Evidence
 from src.tools.news_fetcher import fetch_news
+from src.tools.news_dedup import NewsDeduplicator, SignatureCache, weighted_sentiment
 from src.tools.signal_calculators import check_red_flags
+from src.utils.config import load_config
 from uuid import uuid4
 
 class NewsCrew:
+    def __init__(self, deduplicator: Optional[NewsDeduplicator] = None):
+        thresholds = load_config("thresholds")
+        self.sentiment_threshold = thresholds.get("sentiment_threshold", 0.2)
+        if deduplicator is None:
+            storage = load_config("storage")
+            deduplicator = NewsDeduplicator(
+                SignatureCache(storage.get("news_signature_cache_path", "data/news_signatures.db")),
+                max_distance=thresholds.get("news_dedup_max_distance", 7)
+            )
+        self.deduplicator = deduplicator
+
     def execute(self, inputs: dict) -> list[Evidence]:
         ticker = inputs.get("ticker", "UNKNOWN")
         news_items = fetch_news(ticker)
-        red_flags = check_red_flags(news_items)
+
+        # Collapse syndicated copies so each story is analysed once
+        stories = self.deduplicator.cluster(news_items)
+        red_flags = check_red_flags(stories)
         
+        return self.build_evidence(ticker, stories, red_flags, sentiment_threshold=self.sentiment_threshold)
+
+    @staticmethod
+    def build_evidence(ticker: str, news_items: list, red_flags: list,
+                       timestamp: Optional[datetime] = None, sentiment_threshold: float = 0.2) -> list[Evidence]:
+        timestamp = timestamp or datetime.utcnow()
         evidences = []
+        article_count = sum(item.get("cluster_size", 1) for item in news_items)
         
         # General Sentiment
         evidences.append(Evidence(
             id=str(uuid4()),
             source_type="news",
             source_ref="mock_news_api",
-            claim=f"Found {len(news_items)} recent articles for {ticker}",
+            claim=f"Found {article_count} recent articles ({len(news_items)} unique stories) for {ticker}",
             confidence=0.8,
+            timestamp=timestamp,
             tags=["volume", "sentiment"]
         ))
+
+        score = weighted_sentiment(news_items)
+        if score is not None:
+            if score > sentiment_threshold:
+                tone = "positive"
+            elif score < -sentiment_threshold:
+                tone = "negative"
+            else:
+                tone = "neutral"
+            evidences.append(Evidence(
+                id=str(uuid4()),
+                source_type="news",
+                source_ref="mock_news_api",
+                claim=f"Cluster-weighted news sentiment for {ticker} is {tone} ({score:+.2f})",
+                confidence=0.7,
+                timestamp=timestamp,
+                tags=["sentiment"]
+            ))
         
         # Red Flags
         if red_flags:
@@ -29,6 +73,7 @@ class NewsCrew:
                 source_ref="mock_news_api",
                 claim=f"Identified potential red flags: {', '.join(red_flags)}",
                 confidence=0.7,
+                timestamp=timestamp,
                 tags=["risk", "legal"]
             ))
             
@@ -1,3 +1,5 @@
+from datetime import datetime
+from typing import Optional
 from src.schemas.evidence import Evidence
 from src.tools.price_fetcher import fetch_prices
 from src.tools.signal_calculators import compute_volatility, compute_drawdown
@@ -11,6 +13,12 @@ class PriceCrew:
         volatility = compute_volatility(prices)
         drawdown = compute_drawdown(prices)
         
+        return self.build_evidence(ticker, prices, volatility, drawdown)
+
+    @staticmethod
+    def build_evidence(ticker: str, prices: list, volatility: float, drawdown: float,
+                       timestamp: Optional[datetime] = None) -> list[Evidence]:
+        timestamp = timestamp or datetime.utcnow()
         evidences = []
         evidences.append(Evidence(
             id=str(uuid4()),
@@ -18,6 +26,7 @@ class PriceCrew:
             source_ref="mock_price_feed",
             claim=f"Volatility for {ticker} is {volatility:.2%}",
             confidence=0.95,
+            timestamp=timestamp,
             raw_snippet=str(prices[-5:]),
             tags=["volatility", "risk"]
         ))
@@ -27,6 +36,7 @@ class PriceCrew:
             source_ref="mock_price_feed",
             claim=f"Max drawdown for {ticker} is {drawdown:.2%}",
             confidence=1.0,
+            timestamp=timestamp,
             tags=["drawdown", "risk"]
         ))
         
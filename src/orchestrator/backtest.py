@@ -0,0 +1,254 @@
+import bisect
+import csv
+import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from src.crews.news_crew import NewsCrew
+from src.crews.price_crew import PriceCrew
+from src.schemas.report import Verdict
+from src.tools.news_dedup import NewsDeduplicator, SignatureCache
+from src.tools.news_fetcher import fetch_news
+from src.tools.price_fetcher import fetch_prices
+from src.tools.signal_calculators import check_red_flags
+from src.utils.config import load_config
+from src.utils.io import ensure_dir, write_json
+
+from .synthesis import Synthesizer
+from .verdict import VerdictEngine
+
+logger = logging.getLogger(__name__)
+
+# fetch_prices compatible: (ticker, trading days) -> bars, oldest first
+PriceSource = Callable[[str, int], List[Dict[str, Any]]]
+# fetch_news compatible: (ticker, calendar days, end date) -> articles
+NewsSource = Callable[[str, int, Optional[date]], List[Dict[str, Any]]]
+
+HORIZON_TRADING_DAYS = {"1w": 5, "1m": 21, "3m": 63, "1y": 252}
+
+BULLISH = {Verdict.STRONG_BUY, Verdict.BUY}
+BEARISH = {Verdict.STRONG_SELL, Verdict.SELL, Verdict.DO_NOT_TOUCH}
+
+class PriceHistory:
+    """
+    Full close history for one ticker with prefix sums of daily returns, so the
+    volatility of any trailing window is O(1) and overlapping windows share work.
+    """
+
+    def __init__(self, bars: List[Dict[str, Any]]):
+        self.bars = bars
+        self.dates = [b["date"][:10] for b in bars]
+        self.closes = [float(b["close"]) for b in bars]
+
+        self._sum = [0.0]
+        self._sum_sq = [0.0]
+        for i in range(1, len(self.closes)):
+            r = (self.closes[i] - self.closes[i - 1]) / self.closes[i - 1]
+            self._sum.append(self._sum[-1] + r)
+            self._sum_sq.append(self._sum_sq[-1] + r * r)
+
+    def __len__(self) -> int:
+        return len(self.closes)
+
+    def volatility(self, end: int, window: int) -> float:
+        # Matches compute_volatility over closes[end - window + 1 : end + 1]
+        start = end - window + 1
+        count = window - 1
+        if start < 0 or count < 1:
+            return 0.0
+        total = self._sum[end] - self._sum[start]
+        total_sq = self._sum_sq[end] - self._sum_sq[start]
+        mean = total / count
+        variance = max(total_sq / count - mean * mean, 0.0)
+        return math.sqrt(variance) * math.sqrt(252)
+
+    def drawdown(self, end: int, window: int) -> float:
+        # Matches compute_drawdown over closes[end - window + 1 : end + 1]
+        closes = self.closes
+        start = max(end - window + 1, 0)
+        peak = closes[start]
+        max_dd = 0.0
+        for i in range(start, end + 1):
+            p = closes[i]
+            if p > peak:
+                peak = p
+            dd = (p - peak) / peak
+            if dd < max_dd:
+                max_dd = dd
+        return max_dd
+
+    def forward_return(self, idx: int, steps: int) -> Optional[float]:
+        if idx + steps >= len(self.closes):
+            return None
+        return self.closes[idx + steps] / self.closes[idx] - 1.0
+
+class NewsHistory:
+    """
+    Articles for one ticker sorted by date, with SimHash signatures and red
+    flags computed once per article and sliced per snapshot by binary search.
+
+    Each window is clustered on its own like NewsCrew does for a live run, so
+    copies published after the snapshot never count towards a story.
+    """
+
+    def __init__(self, articles: List[Dict[str, Any]], deduplicator: Optional[NewsDeduplicator] = None):
+        self.deduplicator = deduplicator or NewsDeduplicator()
+        self.articles = sorted(articles, key=lambda a: a.get("date", ""))
+        self.dates = [a.get("date", "")[:10] for a in self.articles]
+        self.signatures = self.deduplicator.signatures(self.articles)
+        self.red_flags = [check_red_flags([a]) for a in self.articles]
+
+    def window(self, start_date: str, end_date: str):
+        lo = bisect.bisect_left(self.dates, start_date)
+        hi = bisect.bisect_right(self.dates, end_date)
+        stories = self.deduplicator.cluster(self.articles[lo:hi], self.signatures[lo:hi])
+
+        # A representative is the first article of the window with its signature
+        first_seen: Dict[int, int] = {}
+        for i in range(lo, hi):
+            first_seen.setdefault(self.signatures[i], i)
+        flags = [flag for story in stories for flag in self.red_flags[first_seen[int(story["cluster_id"], 16)]]]
+        return stories, flags
+
+class Backtester:
+    """
+    Replays point-in-time snapshots of every (ticker, date) through the
+    Synthesizer and VerdictEngine and scores verdicts against forward returns.
+
+    Only price and news evidence is rebuilt per snapshot; the fundamentals
+    mock has no history to take a point-in-time view of.
+    """
+
+    def __init__(
+        self,
+        price_source: PriceSource = fetch_prices,
+        news_source: NewsSource = fetch_news,
+        horizon: str = "1m",
+        price_window: int = 30,
+        news_window_days: int = 7,
+        hold_band: float = 0.02,
+    ):
+        self.price_source = price_source
+        self.news_source = news_source
+        self.horizon = horizon
+        self.forward_steps = HORIZON_TRADING_DAYS[horizon]
+        self.price_window = price_window
+        self.news_window_days = news_window_days
+        self.hold_band = hold_band
+        self.synthesizer = Synthesizer()
+        self.verdict_engine = VerdictEngine()
+        # Plain settings rather than an open cache so the backtester pickles into worker processes
+        self.dedup_max_distance = load_config("thresholds").get("news_dedup_max_distance", 7)
+        self.signature_cache_path = load_config("storage").get("news_signature_cache_path", "data/news_signatures.db")
+
+    def backtest_ticker(self, ticker: str, days: int, step: int = 1) -> List[Dict[str, Any]]:
+        prices = PriceHistory(self.price_source(ticker, days))
+        if not len(prices):
+            return []
+        # `days` counts bars; news is fetched for the calendar span they cover, plus the lookback of the first snapshot
+        first, last = date.fromisoformat(prices.dates[0]), date.fromisoformat(prices.dates[-1])
+        news_days = (last - first).days + self.news_window_days
+        deduplicator = NewsDeduplicator(SignatureCache(self.signature_cache_path), max_distance=self.dedup_max_distance)
+        news = NewsHistory(self.news_source(ticker, news_days, last), deduplicator)
+
+        rows = []
+        for end in range(self.price_window - 1, len(prices) - self.forward_steps, step):
+            as_of = prices.dates[end]
+            as_of_dt = datetime.fromisoformat(as_of)
+
+            volatility = prices.volatility(end, self.price_window)
+            drawdown = prices.drawdown(end, self.price_window)
+            window_start = (as_of_dt - timedelta(days=self.news_window_days - 1)).strftime("%Y-%m-%d")
+            articles, red_flags = news.window(window_start, as_of)
+
+            evidences = PriceCrew.build_evidence(
+                ticker, prices.bars[end - 4:end + 1], volatility, drawdown, timestamp=as_of_dt
+            )
+            evidences += NewsCrew.build_evidence(ticker, articles, red_flags, timestamp=as_of_dt)
+
+            signals = self.synthesizer.build_signals(evidences)
+            verdict, _, confidence = self.verdict_engine.compute_verdict(signals, evidences)
+            forward = prices.forward_return(end, self.forward_steps)
+
+            rows.append({
+                "ticker": ticker,
+                "date": as_of,
+                "verdict": verdict.value,
+                "confidence": round(confidence, 4),
+                "forward_return": round(forward, 6),
+                "hit": self._is_hit(verdict, forward),
+            })
+        return rows
+
+    def _is_hit(self, verdict: Verdict, forward: float) -> bool:
+        if verdict in BULLISH:
+            return forward > 0
+        if verdict in BEARISH:
+            return forward < 0
+        return abs(forward) <= self.hold_band
+
+    def run(self, tickers: List[str], days: int, step: int = 1, workers: int = 1,
+            output_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Backtests every ticker over `days` of history and returns hit rates per
+        verdict label. Per-snapshot rows are written to `output_path` if given.
+        """
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                jobs = [(self, t, days, step) for t in tickers]
+                stats, total = self._aggregate(pool.map(_backtest_ticker_job, jobs), output_path)
+        else:
+            stats, total = self._aggregate((self.backtest_ticker(t, days, step) for t in tickers), output_path)
+
+        by_verdict = {
+            label: {
+                "count": int(b["count"]),
+                "hit_rate": round(b["hits"] / b["count"], 4),
+                "mean_forward_return": round(b["forward_return_sum"] / b["count"], 6),
+            }
+            for label, b in sorted(stats.items())
+        }
+        summary = {
+            "tickers": len(tickers),
+            "snapshots": total,
+            "horizon": self.horizon,
+            "by_verdict": by_verdict,
+        }
+        if output_path:
+            write_json(os.path.splitext(output_path)[0] + "_summary.json", summary)
+        logger.info(f"Backtested {total} snapshots across {len(tickers)} tickers.")
+        return summary
+
+    @staticmethod
+    def _aggregate(per_ticker, output_path: Optional[str]):
+        stats: Dict[str, Dict[str, float]] = {}
+        writer = None
+        out = None
+        if output_path:
+            ensure_dir(os.path.dirname(output_path) or ".")
+            out = open(output_path, "w", newline="", encoding="utf-8")
+            writer = csv.DictWriter(out, fieldnames=["ticker", "date", "verdict", "confidence", "forward_return", "hit"])
+            writer.writeheader()
+
+        total = 0
+        try:
+            for rows in per_ticker:
+                for row in rows:
+                    bucket = stats.setdefault(row["verdict"], {"count": 0, "hits": 0, "forward_return_sum": 0.0})
+                    bucket["count"] += 1
+                    bucket["hits"] += int(row["hit"])
+                    bucket["forward_return_sum"] += row["forward_return"]
+                if writer:
+                    writer.writerows(rows)
+                total += len(rows)
+        finally:
+            if out:
+                out.close()
+        return stats, total
+
+def _backtest_ticker_job(args) -> List[Dict[str, Any]]:
+    backtester, ticker, days, step = args
+    return backtester.backtest_ticker(ticker, days, step)
@@ -0,0 +1,46 @@
+from typing import Iterable, List, Optional, Set, Tuple
+from src.schemas.evidence import Evidence
+from src.schemas.report import Verdict
+from .synthesis import Synthesizer
+from .verdict import SCORE_COMPONENT_RANGES, VerdictEngine
+
+# Score components each crew's evidence can move (see Synthesizer.build_signals).
+# Crews not listed are assumed to be able to move every component.
+CREW_SCORE_COMPONENTS = {
+    "PriceCrew": {"volatility"},
+    "NewsCrew": {"sentiment", "event"},
+    "FundamentalsCrew": {"momentum"},
+    "OptionsLiquidityCrew": set(),  # market_data evidence only feeds uncertainty
+    "RegulationLegalCrew": {"sentiment", "event"},
+    "DebateCrew": set(),
+}
+
+# Crews TriggerEngine can spawn once the base plan has finished
+TRIGGER_CREWS = {"OptionsLiquidityCrew", "RegulationLegalCrew", "NewsCrew", "DebateCrew"}
+
+class EarlyDecisionPolicy:
+    """
+    Decides whether the verdict label is already fixed given the evidence so far
+    and the crews that may still contribute evidence.
+    """
+
+    def __init__(self, synthesizer: Synthesizer, verdict_engine: VerdictEngine):
+        self.synthesizer = synthesizer
+        self.verdict_engine = verdict_engine
+
+    def open_components(self, outstanding_crews: Iterable[str]) -> Set[str]:
+        components: Set[str] = set()
+        for crew in outstanding_crews:
+            components |= CREW_SCORE_COMPONENTS.get(crew, set(SCORE_COMPONENT_RANGES))
+        return components
+
+    def check(self, evidences: List[Evidence], outstanding_crews: Iterable[str]) -> Tuple[Optional[Verdict], Tuple[float, float]]:
+        """
+        Returns the settled verdict (or None) and the reachable score bounds.
+        """
+        signals = self.synthesizer.build_signals(evidences)
+        low, high = self.verdict_engine.score_bounds(signals, self.open_components(outstanding_crews))
+        low_label = self.verdict_engine.label_for_score(low)
+        if low_label == self.verdict_engine.label_for_score(high):
+            return low_label, (low, high)
+        return None, (low, high)
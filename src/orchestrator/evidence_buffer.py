@@ -0,0 +1,52 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Annotated, Iterable, List, Optional
+
+from pydantic import Field, TypeAdapter
+
+from src.schemas.evidence import Evidence
+
+@dataclass(slots=True)
+class EvidenceRecord:
+    """
+    Slotted in-memory form of `Evidence` used inside the orchestrator. Records are
+    built from already-validated crew output and are only validated again when
+    read back from disk.
+    """
+
+    id: str
+    source_type: str
+    source_ref: str
+    claim: str
+    confidence: Annotated[float, Field(ge=0.0, le=1.0)]
+    timestamp: datetime
+    raw_snippet: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_model(cls, ev: Evidence) -> "EvidenceRecord":
+        return cls(ev.id, ev.source_type, ev.source_ref, ev.claim, ev.confidence, ev.timestamp, ev.raw_snippet, ev.tags)
+
+    def to_model(self) -> Evidence:
+        # Fields were validated when the crew produced them
+        return Evidence.model_construct(
+            id=self.id,
+            source_type=self.source_type,
+            source_ref=self.source_ref,
+            claim=self.claim,
+            confidence=self.confidence,
+            timestamp=self.timestamp,
+            raw_snippet=self.raw_snippet,
+            tags=self.tags,
+        )
+
+_RECORD_LIST = TypeAdapter(List[EvidenceRecord])
+
+def to_records(evidences: Iterable) -> List[EvidenceRecord]:
+    return [ev if isinstance(ev, EvidenceRecord) else EvidenceRecord.from_model(ev) for ev in evidences]
+
+def dump_evidence_json(records: List[EvidenceRecord]) -> bytes:
+    return _RECORD_LIST.dump_json(records, indent=2)
+
+def load_evidence_json(data: bytes) -> List[EvidenceRecord]:
+    return _RECORD_LIST.validate_json(data)
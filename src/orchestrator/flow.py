@@ -1,18 +1,31 @@
 import logging
 import os
-from datetime import datetime
-from typing import List
+import threading
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from src.schemas.request import RequestInput
 from src.schemas.report import VerdictReport
 from src.schemas.evidence import Evidence
 from src.schemas.plan import ResearchTaskSpec, ResearchPlan
-from src.utils.io import write_json, write_text, write_jsonl
+from src.tools.evidence_store import EvidenceStore, inputs_digest
+from src.tools.task_queue import CANCELLED, FAILED, TaskQueue
+from src.utils.config import load_config
+from src.utils.profiling import PROFILE_DIR, RunProfiler
+from src.utils.io import read_json, read_jsonl, write_bytes, write_json, write_text, write_jsonl
 
 from .planner import Planner
 from .triggers import TriggerEngine
 from .synthesis import Synthesizer
 from .verdict import VerdictEngine
+from .routing import ModelRouter
+from .early_decision import EarlyDecisionPolicy, TRIGGER_CREWS
+from .evidence_buffer import EvidenceRecord, dump_evidence_json, load_evidence_json, to_records
+from .retrieval import EvidenceRetriever
 
 # Import Crews
 from src.crews.price_crew import PriceCrew
@@ -25,11 +38,52 @@ from src.crews.debate_crew import DebateCrew
 logger = logging.getLogger(__name__)
 
 class OrchestratorFlow:
-    def __init__(self):
+    def __init__(self, store: Optional[EvidenceStore] = None, early_decision: bool = False,
+                 deadline_seconds: Optional[float] = None, queue: Optional[TaskQueue] = None, profile: bool = False):
+        storage = load_config("storage")
+        self.runs_dir = storage.get("runs_dir", "runs")
+        self.store = store if store is not None else EvidenceStore(storage.get("evidence_store_path", "data/evidence.db"))
+        self.reuse_max_age = timedelta(hours=storage.get("evidence_reuse_max_age_hours", 0))
+
         self.planner = Planner()
         self.triggers = TriggerEngine()
         self.synthesizer = Synthesizer()
         self.verdict_engine = VerdictEngine()
+        self.router = ModelRouter()
+
+        self.early_decision = early_decision
+        self.early_policy = EarlyDecisionPolicy(self.synthesizer, self.verdict_engine)
+        self.early_stop: Optional[Dict] = None
+        # Seeded from earlier runs so early-decision savings can be estimated from the first task
+        self.crew_latency_ms: Dict[str, float] = self.store.crew_latencies()
+
+        execution = load_config("execution")
+        self.default_crew_latency_ms = execution.get("default_crew_latency_ms", 1000)
+        self.default_crew_latencies_ms: Dict[str, float] = execution.get("default_crew_latencies_ms") or {}
+        self.deadline_seconds = deadline_seconds if deadline_seconds is not None else execution.get("run_deadline_seconds", 300)
+        self.crew_timeout = execution.get("crew_timeout_seconds", 60)
+        self.crew_timeouts: Dict[str, float] = execution.get("crew_timeouts") or {}
+        self.max_parallel_tasks = max(1, execution.get("max_parallel_tasks", 4))
+        self.coverage_penalty = execution.get("missing_category_confidence_penalty", 0.25)
+        self._run_deadline = float("inf")
+        self.failed_tasks: List[str] = []
+        self.timed_out_tasks: List[str] = []
+        self.last_run_dir: Optional[str] = None
+        self._checkpoints: Dict[str, List[EvidenceRecord]] = {}
+
+        # Crews that receive retrieved bull/bear evidence instead of the full list
+        self.retrieval_crews = set(load_config("model").get("retrieval_crews", ["DebateCrew"]))
+        self._retriever: Optional[EvidenceRetriever] = None
+
+        # Per-stage/per-crew CPU and allocation profiles under <run_dir>/profile
+        self.profile = profile
+        self.profile_top_n = execution.get("profile_top_n", 20)
+        self.profile_sample_interval = execution.get("profile_sample_interval_ms", 5) / 1000
+        self._profiler: Optional[RunProfiler] = None
+
+        # With a queue, crew tasks are dispatched to `market-research worker` processes
+        self.queue = queue
+        self._remote_jobs: Dict[str, str] = {}
         
         self.crews = {
             "PriceCrew": PriceCrew(),
@@ -40,74 +94,440 @@ class OrchestratorFlow:
             "DebateCrew": DebateCrew()
         }
 
-    def run(self, ticker: str, horizon: str, risk_profile: str) -> str:
-        run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{ticker}"
-        run_dir = f"runs/{run_id}"
+    def run(self, ticker: str, horizon: str, risk_profile: str, run_id: Optional[str] = None) -> str:
+        run_id = run_id or f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{ticker}"
+        run_dir = f"{self.runs_dir}/{run_id}"
         os.makedirs(run_dir, exist_ok=True)
+        self.last_run_dir = run_dir
         
         request = RequestInput(ticker=ticker, horizon=horizon, risk_profile=risk_profile)
-        self._log_event(run_dir, "RUN_STARTED", {"ticker": ticker, "run_id": run_id})
+        self._log_event(run_dir, "RUN_STARTED", {"ticker": ticker, "run_id": run_id, "horizon": horizon, "risk_profile": risk_profile})
         
-        # 1. Plan
-        plan = self.planner.create_base_plan(request)
-        self._log_event(run_dir, "PLAN_CREATED", {"task_count": len(plan.tasks)})
-        write_json(f"{run_dir}/plan.json", plan.model_dump())
+        self._start_profiler(run_dir)
+        try:
+            # 1. Plan
+            with self._scope("stage.plan"):
+                plan = self.planner.create_base_plan(request)
+                for task in plan.tasks:
+                    task.model = self.router.select(task)
+                self._log_event(run_dir, "PLAN_CREATED", {"task_count": len(plan.tasks)})
+                write_json(f"{run_dir}/plan.json", plan.model_dump())
+            
+            return self._run_pipeline(run_dir, request, plan, {})
+        finally:
+            self._finish_profiler()
+
+    def resume(self, run_id: str) -> str:
+        """
+        Continues an interrupted run from its checkpoints: finished tasks are
+        restored instead of re-executed, and fired triggers are not re-evaluated.
+        A completed run is only continued if some of its tasks failed or timed out.
+        """
+        run_dir = run_id if os.path.isdir(run_id) else f"{self.runs_dir}/{run_id}"
+        if not os.path.exists(f"{run_dir}/plan.json"):
+            raise FileNotFoundError(f"No checkpointed plan in {run_dir}")
+        self.last_run_dir = run_dir
+        self.failed_tasks = []
+        self.timed_out_tasks = []
+
+        events = read_jsonl(f"{run_dir}/events.jsonl")
+        plan = ResearchPlan.model_validate(read_json(f"{run_dir}/plan.json"))
+        trigger_tasks = None
+        if os.path.exists(f"{run_dir}/triggers.json"):
+            trigger_tasks = [ResearchTaskSpec.model_validate(t) for t in read_json(f"{run_dir}/triggers.json")]
+        checkpoints = self._load_checkpoints(run_dir)
+
+        if any(e["type"] == "run_COMPLETE" for e in events):
+            unfinished = _unfinished_tasks(events, plan.tasks + (trigger_tasks or []), checkpoints)
+            if not unfinished:
+                logger.info(f"Run {run_dir} already completed; nothing to resume")
+                return run_dir
+            logger.info(f"Run {run_dir} completed without {', '.join(unfinished)}; retrying them")
+
+        started = next((e for e in events if e["type"] == "RUN_STARTED"), {})
+        ticker = started.get("ticker") or os.path.basename(run_dir).rsplit("_", 1)[-1]
+        request = RequestInput(ticker=ticker, horizon=started.get("horizon", "1m"), risk_profile=started.get("risk_profile", "normal"))
+
+        # Latency estimates for early decisions are rebuilt from the events log
+        for event in events:
+            if event["type"] == "TASK_FINISHED" and event.get("latency_ms") is not None:
+                previous = self.crew_latency_ms.get(event["crew"])
+                latency_ms = event["latency_ms"]
+                self.crew_latency_ms[event["crew"]] = latency_ms if previous is None else 0.8 * previous + 0.2 * latency_ms
+
+        if any(t.id not in checkpoints for t in plan.tasks):
+            stage = "base"
+        elif trigger_tasks is None or any(t.id not in checkpoints for t in trigger_tasks):
+            stage = "trigger"
+        else:
+            stage = "verdict"
+        self._log_event(run_dir, "RUN_RESUMED", {"run_id": os.path.basename(run_dir), "stage": stage, "restored_tasks": len(checkpoints)})
+        logger.info(f"Resuming {run_dir} at the {stage} stage ({len(checkpoints)} tasks restored)")
+        self._start_profiler(run_dir)
+        try:
+            return self._run_pipeline(run_dir, request, plan, checkpoints, trigger_tasks)
+        finally:
+            self._finish_profiler()
+
+    def run_or_resume(self, ticker: str, horizon: str, risk_profile: str, run_id: str) -> str:
+        """
+        Resumes `run_id` when it already has a checkpointed plan, otherwise starts it.
+        """
+        if os.path.exists(f"{self.runs_dir}/{run_id}/plan.json"):
+            return self.resume(run_id)
+        return self.run(ticker, horizon, risk_profile, run_id=run_id)
+
+    def _run_pipeline(self, run_dir: str, request: RequestInput, plan: ResearchPlan,
+                      checkpoints: Dict[str, List[EvidenceRecord]], trigger_tasks: Optional[List[ResearchTaskSpec]] = None) -> str:
+        self._run_deadline = time.monotonic() + self.deadline_seconds
+        self.failed_tasks = []
+        self.timed_out_tasks = []
+        self._checkpoints = checkpoints
         
         # 2. Execute Base Plan
-        evidences = self._execute_tasks(plan.tasks, run_dir)
+        self.early_stop = None
+        # Crews run in their own threads; the waiting stage itself is not cProfiled
+        with self._scope("stage.base_tasks", cpu_profile=False):
+            evidences = self._execute_tasks(plan.tasks, run_dir, pending_crews=TRIGGER_CREWS)
         
         # 3. Synthesis & Triggers
-        signals = self.synthesizer.build_signals(evidences)
-        new_tasks = self.triggers.evaluate(request, evidences, signals)
+        with self._scope("stage.triggers"):
+            signals = self.synthesizer.build_signals(evidences)
+            new_tasks = trigger_tasks or []
+            if trigger_tasks is None and self.early_stop is None and not self._deadline_reached([], run_dir):
+                new_tasks = self.triggers.evaluate(request, evidences, signals)
+                for task in new_tasks:
+                    task.model = self.router.select(task)
+                # Persisted even when empty so a resumed run does not re-evaluate triggers
+                write_json(f"{run_dir}/triggers.json", [t.model_dump() for t in new_tasks])
+                if new_tasks:
+                    self._log_event(run_dir, "TRIGGERS_FIRED", {"new_tasks": [t.name for t in new_tasks]})
         
         if new_tasks:
-            self._log_event(run_dir, "TRIGGERS_FIRED", {"new_tasks": [t.name for t in new_tasks]})
-            new_evidences = self._execute_tasks(new_tasks, run_dir)
-            evidences.extend(new_evidences)
-            
-            # Re-synthesize
-            signals = self.synthesizer.build_signals(evidences)
+            with self._scope("stage.trigger_tasks", cpu_profile=False):
+                new_evidences = self._execute_tasks(new_tasks, run_dir, prior=evidences)
+                evidences.extend(new_evidences)
+                
+                # Re-synthesize
+                signals = self.synthesizer.build_signals(evidences)
             
-        write_json(f"{run_dir}/evidence.json", [e.model_dump() for e in evidences])
+        with self._scope("stage.output"):
+            write_bytes(f"{run_dir}/evidence.json", dump_evidence_json(evidences))
         
         # 4. Verdict
+        with self._scope("stage.verdict"):
+            report = self._build_report(run_dir, request, plan, evidences, signals)
+        
+        # 5. Output
+        with self._scope("stage.output"):
+            write_text(f"{run_dir}/final_report.json", report.model_dump_json(indent=2))
+            self._render_markdown(f"{run_dir}/final_report.md", report)
+        
+        self._log_event(run_dir, "run_COMPLETE", {"verdict": report.verdict, "early_decision": self.early_stop is not None})
+        logger.info(f"Run completed. Verdict: {report.verdict}. Output: {run_dir}")
+        return run_dir
+
+    def _build_report(self, run_dir: str, request: RequestInput, plan: ResearchPlan,
+                      evidences: List[EvidenceRecord], signals) -> VerdictReport:
         verdict_label, rationale, confidence = self.verdict_engine.compute_verdict(signals, evidences)
+        risks = list(signals.news_red_flags)
+
+        # Degrade confidence for price/news/fundamental categories left uncovered (R6)
+        missing = self.synthesizer.missing_categories(evidences)
+        if missing:
+            degraded = self.verdict_engine.degrade_confidence(confidence, len(missing), self.coverage_penalty)
+            self._log_event(run_dir, "VERDICT_DEGRADED", {
+                "missing_categories": missing,
+                "failed_tasks": self.failed_tasks,
+                "timed_out_tasks": self.timed_out_tasks,
+                "confidence_before": round(confidence, 4),
+                "confidence_after": round(degraded, 4)
+            })
+            confidence = degraded
+            risks.append(f"Incomplete evidence coverage: no {', '.join(missing)} evidence; verdict confidence reduced.")
         
-        report = VerdictReport(
+        # Every component was validated when produced, so skip re-validating the evidence list
+        return VerdictReport.model_construct(
             request=request,
             signals=signals,
             research_plan=plan, # Note via basic plan, in real app update with new tasks
-            evidence=evidences,
+            evidence=[ev.to_model() for ev in evidences],
             verdict=verdict_label,
+            confidence=round(confidence, 4),
             rationale=rationale,
-            risks=signals.news_red_flags,
+            risks=risks,
             next_actions=["Monitor earnings", "Check regulatory updates"]
         )
-        
-        # 5. Output
-        write_json(f"{run_dir}/final_report.json", report.model_dump())
-        self._render_markdown(f"{run_dir}/final_report.md", report)
-        
-        self._log_event(run_dir, "run_COMPLETE", {"verdict": verdict_label})
-        logger.info(f"Run completed. Verdict: {verdict_label}. Output: {run_dir}")
-        return run_dir
 
-    def _execute_tasks(self, tasks: List[ResearchTaskSpec], run_dir: str) -> List[Evidence]:
-        results = []
-        for task in tasks:
-            logger.info(f"Executing task: {task.name} with {task.crew}")
-            self._log_event(run_dir, "TASK_STARTED", {"task": task.name})
-            
-            crew_inst = self.crews.get(task.crew)
-            if crew_inst:
-                task_evidences = crew_inst.execute(task.inputs)
-                results.extend(task_evidences)
-                self._log_event(run_dir, "TASK_FINISHED", {"task": task.name, "evidence_count": len(task_evidences)})
-            else:
-                logger.error(f"Crew {task.crew} not found!")
-                
+    def _execute_tasks(self, tasks: List[ResearchTaskSpec], run_dir: str, prior: Optional[List[EvidenceRecord]] = None,
+                       pending_crews: Iterable[str] = ()) -> List[EvidenceRecord]:
+        results: List[EvidenceRecord] = []
+        pending = list(tasks)
+        started: Dict[str, float] = {}
+
+        while pending:
+            if self.early_decision and self._try_early_stop(pending, (prior or []) + results, pending_crews, run_dir):
+                break
+            if self._deadline_reached(pending, run_dir):
+                break
+
+            running = {}
+            for task in self._next_batch(pending):
+                logger.info(f"Executing task: {task.name} with {task.crew}")
+                self._log_event(run_dir, "TASK_STARTED", {"task": task.name})
+
+                restored = self._checkpoints.get(task.id)
+                if restored is not None:
+                    self._log_event(run_dir, "TASK_RESTORED", {"task": task.name, "crew": task.crew, "evidence_count": len(restored)})
+                    results.extend(restored)
+                    pending.remove(task)
+                    continue
+
+                # Context is part of the inputs, so it must be attached before the reuse lookup
+                if task.crew in self.retrieval_crews:
+                    self._attach_context(task, (prior or []) + results, run_dir)
+                reused = self._reuse_evidence(task, run_dir)
+                if reused is not None:
+                    self._write_checkpoint(task, reused, run_dir)
+                    results.extend(reused)
+                    pending.remove(task)
+                    continue
+
+                crew_inst = self.crews.get(task.crew)
+                if crew_inst is None:
+                    logger.error(f"Crew {task.crew} not found!")
+                    pending.remove(task)
+                    continue
+                timeout = self.crew_timeouts.get(task.crew, self.crew_timeout)
+                if self.queue is not None:
+                    future = _submit(self._run_remote, task, run_dir, timeout)
+                else:
+                    future = _submit(self._run_crew, crew_inst, task)
+                started[task.id] = time.monotonic()
+                running[future] = (task, started[task.id] + timeout)
+
+            while running:
+                # Wake up at the first per-crew timeout or the run deadline, whichever is sooner
+                wake_at = min(min(until for _, until in running.values()), self._run_deadline)
+                done, _ = wait(running, timeout=max(wake_at - time.monotonic(), 0), return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    task, _ = running.pop(future)
+                    pending.remove(task)
+                    try:
+                        task_evidences, metrics = future.result()
+                    except Exception as e:
+                        logger.error(f"Task {task.name} failed: {e}")
+                        self.failed_tasks.append(task.name)
+                        self._log_event(run_dir, "TASK_FAILED", {"task": task.name, "crew": task.crew, "error": repr(e)})
+                        continue
+                    records = to_records(task_evidences)
+                    self._record_finished(task, records, metrics, run_dir)
+                    results.extend(records)
+
+                now = time.monotonic()
+                for future, (task, until) in list(running.items()):
+                    if now >= until or now >= self._run_deadline:
+                        # Threads cannot be killed; the straggler is abandoned and its output discarded
+                        future.cancel()
+                        self._cancel_remote(task)
+                        running.pop(future)
+                        pending.remove(task)
+                        self.timed_out_tasks.append(task.name)
+                        reason = "run_deadline" if now >= self._run_deadline else "crew_timeout"
+                        logger.warning(f"Task {task.name} abandoned ({reason})")
+                        self._log_event(run_dir, "TASK_TIMEOUT", {"task": task.name, "crew": task.crew, "reason": reason})
+
+                if running and self.early_decision and self._try_early_stop(pending, (prior or []) + results, pending_crews, run_dir, started):
+                    for future, (task, _) in running.items():
+                        future.cancel()
+                        self._cancel_remote(task)
+                    pending.clear()
+                    break
+
         return results
 
+    def _next_batch(self, pending: List[ResearchTaskSpec]) -> List[ResearchTaskSpec]:
+        # Leading parallelizable tasks run together; anything else runs on its own
+        if not pending[0].parallelizable:
+            return [pending[0]]
+        batch = []
+        for task in pending:
+            if not task.parallelizable or len(batch) >= self.max_parallel_tasks:
+                break
+            batch.append(task)
+        return batch
+
+    def _deadline_reached(self, pending: List[ResearchTaskSpec], run_dir: str) -> bool:
+        if time.monotonic() < self._run_deadline:
+            return False
+        self.timed_out_tasks.extend(t.name for t in pending)
+        self._log_event(run_dir, "RUN_DEADLINE_REACHED", {"skipped_tasks": [t.name for t in pending]})
+        logger.warning(f"Run deadline reached, skipping {len(pending)} tasks")
+        return True
+
+    def _reuse_evidence(self, task: ResearchTaskSpec, run_dir: str) -> Optional[List[EvidenceRecord]]:
+        if not self.reuse_max_age:
+            return None
+        ticker = task.inputs.get("ticker", "UNKNOWN")
+        reused = self.store.find_reusable(ticker, task.crew, task.name, self.reuse_max_age, inputs_digest(task.inputs))
+        if not reused:
+            return None
+        self._log_event(run_dir, "TASK_REUSED", {"task": task.name, "crew": task.crew, "evidence_count": len(reused)})
+        return to_records(reused)
+
+    def _attach_context(self, task: ResearchTaskSpec, evidences: List[EvidenceRecord], run_dir: str):
+        if self._retriever is None:
+            self._retriever = EvidenceRetriever()
+        context = self._retriever.debate_context(evidences)
+        task.inputs = {**task.inputs, "context": context}
+        self._log_event(run_dir, "CONTEXT_RETRIEVED", {
+            "task": task.name,
+            "candidates": len(evidences),
+            "bull": [item["id"] for item in context["bull"]],
+            "bear": [item["id"] for item in context["bear"]],
+            "chars": sum(len(item["claim"]) for side in context.values() for item in side)
+        })
+
+    def execute_task(self, task: ResearchTaskSpec) -> Tuple[List[Evidence], Dict]:
+        """
+        Runs a single task in-process; used by workers serving queued tasks.
+        """
+        crew_inst = self.crews.get(task.crew)
+        if crew_inst is None:
+            raise ValueError(f"Crew {task.crew} not found")
+        return self._run_crew(crew_inst, task)
+
+    def _run_remote(self, task: ResearchTaskSpec, run_dir: str, timeout: float) -> Tuple[List[EvidenceRecord], Dict]:
+        # Runs on a waiter thread; the caller still enforces crew timeouts and the run deadline
+        job_id = self.queue.enqueue("task", {"task": task.model_dump(), "run_id": os.path.basename(run_dir)})
+        self._remote_jobs[task.id] = job_id
+        job = self.queue.wait([job_id], timeout=timeout).get(job_id)
+        self._remote_jobs.pop(task.id, None)
+        if job is None:
+            self.queue.cancel(job_id)
+            raise TimeoutError(f"Queued task {task.name} ({job_id}) did not finish in {timeout}s")
+        if job.status == CANCELLED:
+            raise RuntimeError(f"Queued task {task.name} ({job_id}) was cancelled")
+        if job.status == FAILED:
+            raise RuntimeError(f"Queued task {task.name} failed after {job.attempts} attempts: {job.error}")
+        return load_evidence_json(job.result["evidence"]), job.result["metrics"]
+
+    def _cancel_remote(self, task: ResearchTaskSpec):
+        # Abandoned queued tasks are cancelled so no worker leases or retries them
+        job_id = self._remote_jobs.pop(task.id, None)
+        if self.queue is not None and job_id is not None:
+            self.queue.cancel(job_id)
+
+    def _run_crew(self, crew_inst, task: ResearchTaskSpec) -> Tuple[List[Evidence], Dict]:
+        # Runs on a worker thread; events and the evidence store are written by the caller
+        with self._scope(f"crew.{task.crew}.{task.name}"):
+            model = self.router.select(task)
+            escalated_from = None
+
+            start = time.perf_counter()
+            task_evidences = crew_inst.execute({**task.inputs, "model": model})
+
+            # Escalate to the smart model when the fast model is not confident enough
+            if self.router.should_escalate(model, task_evidences):
+                logger.info(f"Escalating task {task.name} from {model} to {self.router.smart_model}")
+                escalated_from = model
+                model = self.router.smart_model
+                task_evidences = crew_inst.execute({**task.inputs, "model": model})
+            latency_ms = (time.perf_counter() - start) * 1000
+
+        return task_evidences, {"model": model, "escalated_from": escalated_from, "latency_ms": latency_ms}
+
+    def _record_finished(self, task: ResearchTaskSpec, task_evidences: List[EvidenceRecord], metrics: Dict, run_dir: str):
+        if metrics["escalated_from"]:
+            self._log_event(run_dir, "TASK_ESCALATED", {"task": task.name, "from_model": metrics["escalated_from"], "to_model": metrics["model"]})
+
+        latency_ms = metrics["latency_ms"]
+        previous = self.crew_latency_ms.get(task.crew)
+        self.crew_latency_ms[task.crew] = latency_ms if previous is None else 0.8 * previous + 0.2 * latency_ms
+        self.store.record_latency(task.crew, latency_ms)
+
+        ticker = task.inputs.get("ticker", "UNKNOWN")
+        self.store.add(task_evidences, ticker, run_id=os.path.basename(run_dir), crew=task.crew, task=task.name,
+                       inputs_hash=inputs_digest(task.inputs))
+        self._write_checkpoint(task, task_evidences, run_dir)
+        self._log_event(run_dir, "TASK_FINISHED", {
+            "task": task.name,
+            "crew": task.crew,
+            "model": metrics["model"],
+            "escalated_from": metrics["escalated_from"],
+            "latency_ms": round(latency_ms, 2),
+            "evidence_count": len(task_evidences)
+        })
+
+    def _scope(self, name: str, cpu_profile: bool = True):
+        return self._profiler.scope(name, cpu_profile) if self._profiler is not None else nullcontext()
+
+    def _start_profiler(self, run_dir: str):
+        if not self.profile:
+            return
+        self._profiler = RunProfiler(f"{run_dir}/{PROFILE_DIR}", top_n=self.profile_top_n,
+                                     sample_interval=self.profile_sample_interval or None)
+        self._profiler.start()
+
+    def _finish_profiler(self):
+        # Also runs when the pipeline raised, so a failing run still leaves its profile
+        if self._profiler is None:
+            return
+        profiler, self._profiler = self._profiler, None
+        profiler.stop()
+        summary = profiler.write()
+        slowest = max(summary["scopes"].items(), key=lambda item: item[1]["wall_ms"], default=(None, None))[0]
+        logger.info(f"Profile written to {profiler.output_dir} (slowest scope: {slowest})")
+
+    def _write_checkpoint(self, task: ResearchTaskSpec, task_evidences: List[EvidenceRecord], run_dir: str):
+        write_bytes(f"{run_dir}/checkpoints/{task.id}.json", dump_evidence_json(task_evidences))
+
+    def _load_checkpoints(self, run_dir: str) -> Dict[str, List[EvidenceRecord]]:
+        checkpoints: Dict[str, List[EvidenceRecord]] = {}
+        checkpoint_dir = f"{run_dir}/checkpoints"
+        if not os.path.isdir(checkpoint_dir):
+            return checkpoints
+        for name in os.listdir(checkpoint_dir):
+            if name.endswith(".json"):
+                with open(os.path.join(checkpoint_dir, name), "rb") as f:
+                    checkpoints[name[:-len(".json")]] = load_evidence_json(f.read())
+        return checkpoints
+
+    def _try_early_stop(self, remaining: List[ResearchTaskSpec], evidences: List[EvidenceRecord],
+                        pending_crews: Iterable[str], run_dir: str, started: Optional[Dict[str, float]] = None) -> bool:
+        pending_crews = list(pending_crews)
+        outstanding = [t.crew for t in remaining] + pending_crews
+        label, (low, high) = self.early_policy.check(evidences, outstanding)
+        if label is None:
+            return False
+
+        # Savings are estimated from the latencies observed for each crew, in this or earlier runs;
+        # tasks already running only save what is left of their expected latency
+        started = started or {}
+        now = time.monotonic()
+        saved_ms = 0.0
+        for t in remaining:
+            elapsed_ms = (now - started[t.id]) * 1000 if t.id in started else 0.0
+            saved_ms += max(self._expected_latency_ms(t.crew) - elapsed_ms, 0.0)
+        self.early_stop = {
+            "verdict": label,
+            "score_bounds": [round(low, 2), round(high, 2)],
+            "reason": f"Reachable score range [{low:+.2f}, {high:+.2f}] cannot leave {label.value}",
+            "skipped_tasks": [t.name for t in remaining],
+            "triggers_skipped": bool(pending_crews),
+            "estimated_latency_saved_ms": round(saved_ms, 2),
+            "skipped_by_model": dict(Counter(self.router.select(t) for t in remaining)),
+        }
+        self._log_event(run_dir, "EARLY_DECISION", self.early_stop)
+        logger.info(f"Early decision {label.value}: skipping {len(remaining)} tasks (~{saved_ms:.0f}ms saved)")
+        return True
+
+    def _expected_latency_ms(self, crew: str) -> float:
+        if crew in self.crew_latency_ms:
+            return self.crew_latency_ms[crew]
+        return self.default_crew_latencies_ms.get(crew, self.default_crew_latency_ms)
+
     def _log_event(self, run_dir: str, event_type: str, data: dict):
         event = {
             "timestamp": datetime.now().isoformat(),
@@ -120,7 +540,7 @@ class OrchestratorFlow:
         md = f"""# Market Research Report: {report.request.ticker}
 
 **Verdict**: {report.verdict.value}  
-**Confidence**: {0.8}  
+**Confidence**: {f"{report.confidence:.2f}" if report.confidence is not None else "N/A"}  
 **Date**: {report.request.requested_at}
 
 ## Executive Summary
@@ -144,3 +564,33 @@ class OrchestratorFlow:
         md += "\n---\n**Disclaimer**: Not financial advice. This report is generated by an AI system for research purposes only."
             
         write_text(path, md)
+
+def _unfinished_tasks(events: List[Dict], tasks: List[ResearchTaskSpec], checkpoints: Dict[str, List[EvidenceRecord]]) -> List[str]:
+    """
+    Names of `tasks` that failed, timed out or were cut by the deadline and have no checkpoint.
+    """
+    missed = set()
+    for event in events:
+        if event["type"] in ("TASK_FAILED", "TASK_TIMEOUT"):
+            missed.add(event["task"])
+        elif event["type"] == "RUN_DEADLINE_REACHED":
+            missed.update(event.get("skipped_tasks", []))
+    return [t.name for t in tasks if t.name in missed and t.id not in checkpoints]
+
+def _submit(fn, *args) -> Future:
+    """
+    Runs `fn` on a daemon thread so an abandoned straggler never blocks
+    interpreter exit the way a ThreadPoolExecutor worker would.
+    """
+    future: Future = Future()
+
+    def runner():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=runner, daemon=True).start()
+    return future
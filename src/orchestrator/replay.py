@@ -0,0 +1,132 @@
+import csv
+import json
+import logging
+import os
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterator, Optional
+
+from src.utils.io import ensure_dir, write_json
+
+from .evidence_buffer import load_evidence_json
+from .synthesis import Synthesizer
+from .verdict import VerdictEngine
+
+logger = logging.getLogger(__name__)
+
+RESULT_COLUMNS = ["run_id", "ticker", "old_verdict", "new_verdict", "changed", "confidence", "evidence_count"]
+
+# Per-process engines, created once per worker by _init_worker
+_synthesizer: Optional[Synthesizer] = None
+_verdict_engine: Optional[VerdictEngine] = None
+
+def discover_runs(runs_dir: str) -> Iterator[str]:
+    """
+    Yields run directories under `runs_dir` that contain an evidence.json, oldest first.
+    """
+    if not os.path.isdir(runs_dir):
+        return
+    for name in sorted(os.listdir(runs_dir)):
+        run_dir = os.path.join(runs_dir, name)
+        if os.path.isfile(os.path.join(run_dir, "evidence.json")):
+            yield run_dir
+
+def _init_worker():
+    global _synthesizer, _verdict_engine
+    _synthesizer = Synthesizer()
+    _verdict_engine = VerdictEngine()
+
+def _read_run_metadata(run_dir: str) -> Dict[str, Optional[str]]:
+    # The events log is tiny compared to final_report.json, which embeds all evidence again
+    meta: Dict[str, Optional[str]] = {"ticker": None, "verdict": None}
+    events_path = os.path.join(run_dir, "events.jsonl")
+    if os.path.exists(events_path):
+        with open(events_path, "r", encoding="utf-8") as f:
+            for line in f:
+                event = json.loads(line)
+                if event.get("ticker") and meta["ticker"] is None:
+                    meta["ticker"] = event["ticker"]
+                if "verdict" in event:
+                    meta["verdict"] = event["verdict"]
+    if meta["ticker"] is None:
+        meta["ticker"] = os.path.basename(run_dir).rsplit("_", 1)[-1]
+    return meta
+
+def replay_run(run_dir: str) -> Dict[str, Any]:
+    """
+    Re-scores one stored run through Synthesizer and VerdictEngine only.
+    """
+    if _synthesizer is None:
+        _init_worker()
+
+    with open(os.path.join(run_dir, "evidence.json"), "rb") as f:
+        evidences = load_evidence_json(f.read())
+
+    signals = _synthesizer.build_signals(evidences)
+    verdict, _, confidence = _verdict_engine.compute_verdict(signals, evidences)
+
+    meta = _read_run_metadata(run_dir)
+    return {
+        "run_id": os.path.basename(run_dir),
+        "ticker": meta["ticker"],
+        "old_verdict": meta["verdict"],
+        "new_verdict": verdict.value,
+        "changed": meta["verdict"] is not None and meta["verdict"] != verdict.value,
+        "confidence": round(confidence, 4),
+        "evidence_count": len(evidences),
+    }
+
+def replay_runs(runs_dir: str, output_path: str, workers: Optional[int] = None, max_in_flight: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Replays every stored run under `runs_dir` across `workers` processes and streams
+    one CSV row per run to `output_path`. At most `max_in_flight` runs are queued
+    at a time so memory stays flat regardless of history size.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 4
+    ensure_dir(os.path.dirname(output_path) or ".")
+
+    total = 0
+    failed = 0
+    transitions: Counter = Counter()
+
+    with open(output_path, "w", newline="", encoding="utf-8") as out, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        writer = csv.DictWriter(out, fieldnames=RESULT_COLUMNS)
+        writer.writeheader()
+
+        pending = {}
+        run_dirs = discover_runs(runs_dir)
+
+        def drain(block_until: int):
+            nonlocal total, failed
+            while len(pending) > block_until:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    run_dir = pending.pop(future)
+                    try:
+                        row = future.result()
+                    except Exception as e:
+                        failed += 1
+                        logger.error(f"Replay failed for {run_dir}: {e}")
+                        continue
+                    total += 1
+                    writer.writerow(row)
+                    if row["changed"]:
+                        transitions[f"{row['old_verdict']}->{row['new_verdict']}"] += 1
+
+        for run_dir in run_dirs:
+            pending[pool.submit(replay_run, run_dir)] = run_dir
+            drain(max_in_flight - 1)
+        drain(0)
+
+    summary = {
+        "runs": total,
+        "failed": failed,
+        "changed": sum(transitions.values()),
+        "transitions": dict(transitions),
+        "output": output_path,
+    }
+    write_json(os.path.splitext(output_path)[0] + "_summary.json", summary)
+    logger.info(f"Replayed {total} runs ({summary['changed']} verdict changes). Output: {output_path}")
+    return summary
@@ -0,0 +1,61 @@
+from typing import Any, Dict, List, Optional
+
+from src.tools.embeddings import Embedder, make_embedder
+from src.utils.config import load_config
+
+BULL_QUERY = "bull case upside growth record breaking results analyst upgrade buy undervalued positive sentiment new product"
+BEAR_QUERY = "bear case downside risk lawsuit regulator investigation recall supply chain issues overvalued negative sentiment high volatility drawdown"
+
+class EvidenceRetriever:
+    """
+    Picks the evidence most relevant to the bull and bear cases so crews get a
+    context of at most `top_k` claims per side and `max_chars` characters,
+    however much evidence trigger rounds have added.
+    """
+
+    def __init__(self, embedder: Optional[Embedder] = None, top_k: Optional[int] = None,
+                 max_chars: Optional[int] = None, max_claim_chars: int = 300):
+        model = load_config("model")
+        self.embedder = embedder or make_embedder(model)
+        self.top_k = top_k or model.get("retrieval_top_k", 5)
+        self.max_chars = max_chars or model.get("retrieval_max_chars", 2000)
+        self.max_claim_chars = max_claim_chars
+        self._queries: Optional[List[List[float]]] = None
+
+    def debate_context(self, evidences: List[Any]) -> Dict[str, List[Dict[str, Any]]]:
+        context: Dict[str, List[Dict[str, Any]]] = {"bull": [], "bear": []}
+        # Earlier debate conclusions are not evidence for a new debate
+        candidates = {ev.id: ev for ev in evidences if ev.source_type != "synthesis"}
+        if not candidates:
+            return context
+
+        vectors = self.embedder.embed([ev.claim for ev in candidates.values()])
+        if self._queries is None:
+            self._queries = self.embedder.embed([BULL_QUERY, BEAR_QUERY])
+        bull_query, bear_query = self._queries
+
+        # Exact scan: a run holds at most a few hundred claims, and both scores are
+        # needed anyway because each claim argues one side only, whichever query it is closer to
+        hits: Dict[str, List[tuple]] = {"bull": [], "bear": []}
+        for ev, vector in zip(candidates.values(), vectors):
+            bull = sum(a * b for a, b in zip(bull_query, vector))
+            bear = sum(a * b for a, b in zip(bear_query, vector))
+            side, score = ("bull", bull) if bull >= bear else ("bear", bear)
+            hits[side].append((score * ev.confidence, ev.id))
+
+        for side in ("bull", "bear"):
+            budget = self.max_chars // 2
+            for score, key in sorted(hits[side], reverse=True)[:self.top_k]:
+                ev = candidates[key]
+                claim = ev.claim if len(ev.claim) <= self.max_claim_chars else ev.claim[:self.max_claim_chars - 3] + "..."
+                if len(claim) > budget:
+                    break
+                budget -= len(claim)
+                context[side].append({
+                    "id": ev.id,
+                    "claim": claim,
+                    "source_type": ev.source_type,
+                    "confidence": ev.confidence,
+                    "relevance": round(score, 4),
+                })
+        return context
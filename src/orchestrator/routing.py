@@ -0,0 +1,43 @@
+from typing import Any, Dict, List, Optional
+from src.schemas.evidence import Evidence
+from src.schemas.plan import ResearchTaskSpec
+from src.utils.config import load_config
+import logging
+
+logger = logging.getLogger(__name__)
+
+class ModelRouter:
+    """
+    Chooses between `fast_model` and `smart_model` for each research task.
+
+    Base-plan summarization goes to the fast model; DebateCrew, trigger-spawned
+    deep dives and tasks over long lookback windows go to the smart model.
+    """
+
+    def __init__(self, model_config: Optional[Dict[str, Any]] = None, thresholds: Optional[Dict[str, Any]] = None):
+        model_config = model_config if model_config is not None else load_config("model")
+        thresholds = thresholds if thresholds is not None else load_config("thresholds")
+
+        self.fast_model = model_config.get("fast_model", "gpt-3.5-turbo")
+        self.smart_model = model_config.get("smart_model", "gpt-4-turbo-preview")
+        self.smart_crews = set(model_config.get("smart_crews", ["DebateCrew"]))
+        self.fast_max_lookback_days = model_config.get("fast_model_max_lookback_days", 60)
+        self.min_confidence = thresholds.get("min_confidence_score", 0.6)
+
+    def select(self, task: ResearchTaskSpec) -> str:
+        if task.model:
+            return task.model
+        if task.crew in self.smart_crews:
+            return self.smart_model
+        if task.origin == "trigger":
+            return self.smart_model
+        # Evidence volume: long lookback windows mean more material to summarize
+        if task.inputs.get("days", 0) > self.fast_max_lookback_days:
+            return self.smart_model
+        return self.fast_model
+
+    def should_escalate(self, model: str, evidences: List[Evidence]) -> bool:
+        if model != self.fast_model or not evidences:
+            return False
+        mean_confidence = sum(ev.confidence for ev in evidences) / len(evidences)
+        return mean_confidence < self.min_confidence
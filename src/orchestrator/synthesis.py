@@ -2,7 +2,22 @@ from typing import List
 from src.schemas.evidence import Evidence
 from src.schemas.report import Signals
 
+# R6 coverage categories and the evidence source types that count towards them
+COVERAGE_CATEGORIES = {
+    "price": {"price", "market_data"},
+    "news": {"news"},
+    "fundamental": {"analysis", "filing"},
+}
+
 class Synthesizer:
+    def missing_categories(self, evidences: List[Evidence]) -> List[str]:
+        source_types = {ev.source_type for ev in evidences}
+        tags = {tag for ev in evidences for tag in ev.tags}
+        return [
+            category for category, types in COVERAGE_CATEGORIES.items()
+            if not (source_types & types) and category not in tags
+        ]
+
     def build_signals(self, evidences: List[Evidence]) -> Signals:
         # Base Raw Signals
         volatility = None
@@ -43,7 +58,14 @@ class Synthesizer:
                 event_risk_score = max(event_risk_score, 0.9) # High risk if red flags
             
             # 3. Sentiment Extraction
-            if "sentiment" in ev.tags or "news" in ev.source_type:
+            if "sentiment" in ev.tags and "news sentiment for" in ev.claim:
+                # "Cluster-weighted news sentiment for TSLA is positive (+0.33)"
+                try:
+                    sentiment_sum += float(ev.claim.rsplit("(", 1)[-1].rstrip(")"))
+                    sentiment_count += 1
+                except ValueError:
+                    pass
+            elif "sentiment" in ev.tags or "news" in ev.source_type:
                 # Mock logic: look for keywords in claim
                 if "record breaking" in ev.claim or "positive" in ev.claim or "Buy" in ev.claim:
                     sentiment_sum += 0.8
@@ -8,37 +8,18 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+VOLATILITY_SPIKE_THRESHOLD = 0.40 # 40% threshold example
+# Same cut-off VerdictEngine uses for a sentiment component to count
+CONFLICT_SENTIMENT_THRESHOLD = 0.3
+
 class TriggerEngine:
     def evaluate(self, request: RequestInput, evidences: List[Evidence], signals: Signals) -> List[ResearchTaskSpec]:
-        new_tasks = []
-        
-        # 1. Volatility Spike
-        if signals.volatility_20d and signals.volatility_20d > 0.40: # 40% threshold example
-            logger.info("TRIGGER: Volatility spike detected")
-            new_tasks.append(ResearchTaskSpec(
-                id=str(uuid4()),
-                name="options_liquidity_analysis",
-                description="Investigate options flow and liquidity due to high volatility.",
-                crew="OptionsLiquidityCrew",
-                inputs={"ticker": request.ticker},
-                parallelizable=False
-            ))
-
-        # 2. Legal/Regulatory
-        if signals.news_red_flags:
-            logger.info("TRIGGER: Legal/Regulatory red flags detected")
-            new_tasks.append(ResearchTaskSpec(
-                id=str(uuid4()),
-                name="legal_analysis",
-                description="Deep dive into identified legal risks.",
-                crew="RegulationLegalCrew",
-                inputs={"ticker": request.ticker, "issues": signals.news_red_flags},
-                parallelizable=False
-            ))
+        new_tasks = self.signal_tasks(request.ticker, signals)
             
-        # 3. Conflicting Evidence (Mock logic: if we have mixed sentiment strong signals)
-        # Simplified: Check if we have both strong buy and strong sell signals (not impl in mock thoroughly, but placeholder)
-        
+        # 3. Conflicting Evidence
+        if self.conflicting(signals):
+            new_tasks.append(self.debate_task(request.ticker))
+
         # 4. Insufficient Evidence
         if len(evidences) < 3: # Arbitrary low number
              new_tasks.append(ResearchTaskSpec(
@@ -47,7 +28,72 @@ class TriggerEngine:
                 description="Gather more evidence due to low count.",
                 crew="NewsCrew", # Fallback to more news
                 inputs={"ticker": request.ticker, "days": 90},
-                parallelizable=True
+                parallelizable=True,
+                origin="trigger"
             ))
             
         return new_tasks
+
+    def signal_tasks(self, ticker: str, signals: Signals) -> List[ResearchTaskSpec]:
+        """
+        Rules that depend on signals only; shared with streaming watch mode.
+        """
+        new_tasks = []
+
+        # 1. Volatility Spike
+        if self.volatility_spike(signals.volatility_20d):
+            new_tasks.append(self.volatility_task(ticker))
+
+        # 2. Legal/Regulatory
+        if signals.news_red_flags:
+            new_tasks.append(self.legal_task(ticker, signals.news_red_flags))
+
+        return new_tasks
+
+    def volatility_spike(self, volatility: Optional[float]) -> bool:
+        # Cheap check so watch mode can test every bar without building tasks
+        return bool(volatility) and volatility > VOLATILITY_SPIKE_THRESHOLD
+
+    def volatility_task(self, ticker: str) -> ResearchTaskSpec:
+        logger.info(f"TRIGGER: Volatility spike detected for {ticker}")
+        return ResearchTaskSpec(
+            id=str(uuid4()),
+            name="options_liquidity_analysis",
+            description="Investigate options flow and liquidity due to high volatility.",
+            crew="OptionsLiquidityCrew",
+            inputs={"ticker": ticker},
+            parallelizable=False,
+            origin="trigger"
+        )
+
+    def legal_task(self, ticker: str, red_flags: List[str]) -> ResearchTaskSpec:
+        logger.info(f"TRIGGER: Legal/Regulatory red flags detected for {ticker}")
+        return ResearchTaskSpec(
+            id=str(uuid4()),
+            name="legal_analysis",
+            description="Deep dive into identified legal risks.",
+            crew="RegulationLegalCrew",
+            inputs={"ticker": ticker, "issues": red_flags},
+            parallelizable=False,
+            origin="trigger"
+        )
+
+    def conflicting(self, signals: Signals) -> bool:
+        # Strong sentiment pulling against valuation momentum or flagged risks
+        bullish = signals.sentiment_score > CONFLICT_SENTIMENT_THRESHOLD
+        bearish = signals.sentiment_score < -CONFLICT_SENTIMENT_THRESHOLD
+        if bullish:
+            return signals.momentum_score < 0 or bool(signals.news_red_flags)
+        return bearish and signals.momentum_score > 0
+
+    def debate_task(self, ticker: str) -> ResearchTaskSpec:
+        logger.info(f"TRIGGER: Conflicting evidence detected for {ticker}")
+        return ResearchTaskSpec(
+            id=str(uuid4()),
+            name="debate",
+            description="Weigh the conflicting bull and bear evidence.",
+            crew="DebateCrew",
+            inputs={"ticker": ticker},
+            parallelizable=False,
+            origin="trigger"
+        )
@@ -1,35 +1,86 @@
-from typing import List, Dict, Tuple
+from typing import Iterable, List, Dict, Tuple
 from src.schemas.report import Verdict, Signals
 from src.schemas.evidence import Evidence
 
+# Range each scoring component can contribute to the total score
+SCORE_COMPONENT_RANGES = {
+    "sentiment": (-1.0, 1.0),
+    "momentum": (-1.0, 1.0),
+    "volatility": (-0.5, 0.0),
+    "event": (-2.0, 0.0),
+}
+
 class VerdictEngine:
-    def compute_verdict(self, signals: Signals, evidences: List[Evidence]) -> Tuple[Verdict, Dict[str, str], float]:
-        score = 0.0
-        rationale = {"bull_case": [], "bear_case": []}
-        
-        # 1. Feature-based Scoring
-        
+    def score_components(self, signals: Signals) -> Dict[str, float]:
+        components = {name: 0.0 for name in SCORE_COMPONENT_RANGES}
+
         # Sentiment
         if signals.sentiment_score > 0.3:
-            score += 1.0
-            rationale["bull_case"].append(f"Strong positive sentiment ({signals.sentiment_score:.2f}).")
+            components["sentiment"] = 1.0
         elif signals.sentiment_score < -0.3:
-            score -= 1.0
-            rationale["bear_case"].append(f"Negative sentiment ({signals.sentiment_score:.2f}).")
-            
+            components["sentiment"] = -1.0
+
         # Momentum/Valuation
         if signals.momentum_score > 0:
-            score += 1.0
+            components["momentum"] = 1.0
         elif signals.momentum_score < 0:
-            score -= 1.0
-            
+            components["momentum"] = -1.0
+
         # Risks
         if signals.volatility_risk > 0.7:
-            score -= 0.5
-            rationale["bear_case"].append(f"High volatility risk ({signals.volatility_risk:.1f}).")
-            
+            components["volatility"] = -0.5
         if signals.event_risk > 0.5:
-            score -= 2.0
+            components["event"] = -2.0
+
+        return components
+
+    def score_bounds(self, signals: Signals, open_components: Iterable[str]) -> Tuple[float, float]:
+        """
+        Returns the lowest and highest score reachable if every component in
+        `open_components` may still move anywhere in its range.
+        """
+        components = self.score_components(signals)
+        open_components = set(open_components)
+        low = high = 0.0
+        for name, value in components.items():
+            if name in open_components:
+                low += SCORE_COMPONENT_RANGES[name][0]
+                high += SCORE_COMPONENT_RANGES[name][1]
+            else:
+                low += value
+                high += value
+        return low, high
+
+    @staticmethod
+    def label_for_score(score: float) -> Verdict:
+        if score >= 1.5:
+            return Verdict.STRONG_BUY
+        elif score >= 0.5:
+            return Verdict.BUY
+        elif score <= -1.5:
+            return Verdict.STRONG_SELL
+        elif score <= -0.5:
+            return Verdict.SELL
+        return Verdict.HOLD
+
+    @staticmethod
+    def degrade_confidence(confidence: float, missing_count: int, penalty: float) -> float:
+        return max(0.0, confidence * (1.0 - penalty * missing_count))
+
+    def compute_verdict(self, signals: Signals, evidences: List[Evidence]) -> Tuple[Verdict, Dict[str, str], float]:
+        rationale = {"bull_case": [], "bear_case": []}
+        
+        # 1. Feature-based Scoring
+        components = self.score_components(signals)
+        score = sum(components.values())
+
+        if components["sentiment"] > 0:
+            rationale["bull_case"].append(f"Strong positive sentiment ({signals.sentiment_score:.2f}).")
+        elif components["sentiment"] < 0:
+            rationale["bear_case"].append(f"Negative sentiment ({signals.sentiment_score:.2f}).")
+        if components["volatility"] < 0:
+            rationale["bear_case"].append(f"High volatility risk ({signals.volatility_risk:.1f}).")
+        if components["event"] < 0:
             rationale["bear_case"].append(f"Significant event/regulatory risk detected.")
             
         # 2. Evidence Citation Mapping
@@ -47,17 +98,7 @@ class VerdictEngine:
                 
         # 3. Determine Verdict
         confidence = max(0.0, 1.0 - signals.uncertainty)
-        
-        if score >= 1.5:
-            verdict = Verdict.STRONG_BUY
-        elif score >= 0.5:
-            verdict = Verdict.BUY
-        elif score <= -1.5:
-            verdict = Verdict.STRONG_SELL
-        elif score <= -0.5:
-            verdict = Verdict.SELL
-        else:
-            verdict = Verdict.HOLD
+        verdict = self.label_for_score(score)
             
         # 4. Final Formatting
         final_rationale = {
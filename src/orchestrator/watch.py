@@ -0,0 +1,242 @@
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import uuid4
+
+from src.schemas.plan import ResearchTaskSpec
+from src.tools.evidence_store import inputs_digest
+from src.tools.signal_calculators import check_red_flags
+from src.tools.streams import StreamEvent, StreamSource
+from src.utils.config import load_config
+from src.utils.io import write_jsonl
+
+from .evidence_buffer import to_records
+from .flow import OrchestratorFlow
+from .triggers import TriggerEngine
+
+logger = logging.getLogger(__name__)
+
+class RollingStats:
+    """
+    O(1) per-bar rolling volatility (annualized, as in `compute_volatility`) over
+    the last `window` returns, and drawdown of the latest close from the peak of
+    the last `window + 1` closes.
+    """
+
+    __slots__ = ("window", "returns", "ret_sum", "ret_sq_sum", "peaks", "count", "last_close")
+
+    # Running sums are rebuilt from the window this often to shed float drift
+    RESUM_EVERY = 1000
+
+    def __init__(self, window: int = 20):
+        self.window = window
+        self.returns: deque = deque()
+        self.ret_sum = 0.0
+        self.ret_sq_sum = 0.0
+        self.peaks: deque = deque()  # (index, close), closes strictly decreasing
+        self.count = 0
+        self.last_close: Optional[float] = None
+
+    def update(self, close: float):
+        if self.last_close:
+            ret = (close - self.last_close) / self.last_close
+            self.returns.append(ret)
+            self.ret_sum += ret
+            self.ret_sq_sum += ret * ret
+            if len(self.returns) > self.window:
+                old = self.returns.popleft()
+                self.ret_sum -= old
+                self.ret_sq_sum -= old * old
+            if self.count % self.RESUM_EVERY == 0:
+                self.ret_sum = math.fsum(self.returns)
+                self.ret_sq_sum = math.fsum(r * r for r in self.returns)
+
+        while self.peaks and self.peaks[-1][1] <= close:
+            self.peaks.pop()
+        self.peaks.append((self.count, close))
+        if self.peaks[0][0] <= self.count - self.window - 1:
+            self.peaks.popleft()
+
+        self.count += 1
+        self.last_close = close
+
+    @property
+    def volatility(self) -> Optional[float]:
+        n = len(self.returns)
+        if n == 0:
+            return None
+        mean = self.ret_sum / n
+        variance = max(self.ret_sq_sum / n - mean * mean, 0.0)
+        return math.sqrt(variance) * math.sqrt(252)
+
+    @property
+    def drawdown(self) -> Optional[float]:
+        if not self.peaks:
+            return None
+        peak = self.peaks[0][1]
+        return (self.last_close - peak) / peak if peak else 0.0
+
+class WatchEngine:
+    """
+    Evaluates trigger rules on every streamed bar or article and launches the
+    targeted crews only when a rule fires. Price rules fire on the transition
+    into the triggered state; any rule re-fires for a ticker only after
+    `cooldown_seconds`.
+    """
+
+    def __init__(self, flow: Optional[OrchestratorFlow] = None, window: Optional[int] = None,
+                 cooldown_seconds: Optional[float] = None, max_parallel_tasks: Optional[int] = None,
+                 reports_dir: Optional[str] = None):
+        execution = load_config("execution")
+        thresholds = load_config("thresholds")
+        self.flow = flow or OrchestratorFlow()
+        self.triggers = TriggerEngine()
+        self.window = window or execution.get("watch_window", 20)
+        self.cooldown_seconds = cooldown_seconds if cooldown_seconds is not None else execution.get("watch_cooldown_seconds", 900)
+        self.drawdown_threshold = thresholds.get("drawdown_threshold", -0.10)
+
+        self.stats: Dict[str, RollingStats] = {}
+        self.active: Dict[str, Set[str]] = {}
+        self.last_fired: Dict[Tuple[str, str], float] = {}
+        self.event_count = 0
+        self.launched: List[str] = []
+        self.failed: List[str] = []
+
+        self.watch_id = f"watch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.watch_dir = f"{reports_dir or load_config('storage').get('reports_dir', 'reports')}/{self.watch_id}"
+        self._pool = ThreadPoolExecutor(max_workers=max_parallel_tasks or execution.get("watch_max_parallel_tasks", 4))
+        self._lock = threading.Lock()
+
+    def run(self, source: StreamSource, max_events: Optional[int] = None) -> Dict:
+        os.makedirs(self.watch_dir, exist_ok=True)
+        self._log_event("WATCH_STARTED", {"watch_id": self.watch_id, "window": self.window})
+        try:
+            for event in source.events():
+                self.process(event)
+                if max_events is not None and self.event_count >= max_events:
+                    break
+        finally:
+            source.close()
+            self._pool.shutdown(wait=True)
+
+        summary = {
+            "watch_id": self.watch_id,
+            "events": self.event_count,
+            "tickers": len(self.stats),
+            "tasks_launched": len(self.launched),
+            "tasks_failed": len(self.failed),
+            "watch_dir": self.watch_dir,
+        }
+        self._log_event("WATCH_STOPPED", summary)
+        return summary
+
+    def process(self, event: StreamEvent) -> List[ResearchTaskSpec]:
+        """
+        Applies one stream event and returns the tasks it launched.
+        """
+        self.event_count += 1
+        ticker = event.ticker
+        if event.kind == "bar":
+            stats = self.stats.get(ticker)
+            if stats is None:
+                stats = self.stats[ticker] = RollingStats(self.window)
+            stats.update(float(event.data["close"]))
+            # Thresholds are checked on every bar; tasks are only built when a rule
+            # fires on entering the triggered state, not on every bar within it
+            current = self._price_rules(stats)
+            previous = self.active.get(ticker, set())
+            self.active[ticker] = current
+            tasks = [self._price_task(ticker, name) for name in sorted(current - previous)]
+        elif event.kind == "news":
+            red_flags = check_red_flags([event.data])
+            if not red_flags:
+                return []
+            tasks = [self.triggers.legal_task(ticker, red_flags)]
+        else:
+            return []
+
+        now = time.monotonic()
+        launched = []
+        for task in tasks:
+            key = (ticker, task.name)
+            last = self.last_fired.get(key)
+            if last is not None and now - last < self.cooldown_seconds:
+                continue
+            self.last_fired[key] = now
+            self._launch(task, event)
+            launched.append(task)
+        return launched
+
+    def _price_rules(self, stats: RollingStats) -> Set[str]:
+        # Wait for a full window so a handful of early bars cannot trip the rules
+        if len(stats.returns) < self.window:
+            return set()
+        rules = set()
+        if self.triggers.volatility_spike(stats.volatility):
+            rules.add("options_liquidity_analysis")
+        if stats.drawdown <= self.drawdown_threshold:
+            rules.add("drawdown_news_check")
+        return rules
+
+    def _price_task(self, ticker: str, name: str) -> ResearchTaskSpec:
+        if name == "options_liquidity_analysis":
+            return self.triggers.volatility_task(ticker)
+        return ResearchTaskSpec(
+            id=str(uuid4()),
+            name="drawdown_news_check",
+            description="Look for news explaining a drawdown beyond threshold.",
+            crew="NewsCrew",
+            inputs={"ticker": ticker},
+            parallelizable=True,
+            origin="trigger"
+        )
+
+    def _launch(self, task: ResearchTaskSpec, event: StreamEvent):
+        task.model = self.flow.router.select(task)
+        self.launched.append(task.name)
+        ticker = task.inputs.get("ticker", event.ticker)
+        stats = self.stats.get(ticker)
+        self._log_event("WATCH_TRIGGER", {
+            "ticker": ticker,
+            "task": task.name,
+            "crew": task.crew,
+            "event": event.kind,
+            "volatility": round(stats.volatility, 4) if stats and stats.volatility is not None else None,
+            "drawdown": round(stats.drawdown, 4) if stats and stats.drawdown is not None else None,
+        })
+        logger.info(f"Watch trigger {task.name} for {ticker}: launching {task.crew}")
+        future = self._pool.submit(self.flow.execute_task, task)
+        future.add_done_callback(lambda f: self._finished(task, f))
+
+    def _finished(self, task: ResearchTaskSpec, future: Future):
+        ticker = task.inputs.get("ticker", "UNKNOWN")
+        try:
+            task_evidences, metrics = future.result()
+        except Exception as e:
+            logger.error(f"Watch task {task.name} for {ticker} failed: {e}")
+            with self._lock:
+                self.failed.append(task.name)
+            self._log_event("TASK_FAILED", {"ticker": ticker, "task": task.name, "crew": task.crew, "error": repr(e)})
+            return
+        records = to_records(task_evidences)
+        self.flow.store.add(records, ticker, run_id=self.watch_id, crew=task.crew, task=task.name,
+                            inputs_hash=inputs_digest(task.inputs))
+        self._log_event("TASK_FINISHED", {
+            "ticker": ticker,
+            "task": task.name,
+            "crew": task.crew,
+            "model": metrics["model"],
+            "latency_ms": round(metrics["latency_ms"], 2),
+            "evidence_count": len(records)
+        })
+
+    def _log_event(self, event_type: str, data: dict):
+        event = {"timestamp": datetime.now().isoformat(), "type": event_type, **data}
+        with self._lock:
+            write_jsonl(f"{self.watch_dir}/events.jsonl", event)
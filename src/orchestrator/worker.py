@@ -0,0 +1,90 @@
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+from uuid import uuid4
+
+from src.schemas.plan import ResearchTaskSpec
+from src.tools.task_queue import Job, TaskQueue
+
+from .evidence_buffer import dump_evidence_json, to_records
+from .flow import OrchestratorFlow
+
+logger = logging.getLogger(__name__)
+
+class Worker:
+    """
+    Leases jobs from a TaskQueue and executes them: `task` jobs run a single
+    crew and return its evidence, `request` jobs run a full research flow.
+    The lease is renewed from a heartbeat thread while the job runs.
+    """
+
+    def __init__(self, queue: TaskQueue, flow: Optional[OrchestratorFlow] = None, worker_id: Optional[str] = None,
+                 lease_seconds: float = 30, heartbeat_seconds: float = 10, kinds: Iterable[str] = ("task", "request")):
+        self.queue = queue
+        self.flow = flow or OrchestratorFlow()
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:6]}"
+        self.lease_seconds = lease_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.kinds = list(kinds)
+
+    def run(self, max_jobs: Optional[int] = None, idle_exit_seconds: Optional[float] = None, poll_seconds: float = 0.5) -> int:
+        processed = 0
+        idle_since = time.monotonic()
+        while max_jobs is None or processed < max_jobs:
+            if self.run_once():
+                processed += 1
+                idle_since = time.monotonic()
+                continue
+            if idle_exit_seconds is not None and time.monotonic() - idle_since >= idle_exit_seconds:
+                break
+            time.sleep(poll_seconds)
+        return processed
+
+    def run_once(self) -> bool:
+        job = self.queue.lease(self.worker_id, self.kinds, self.lease_seconds)
+        if job is None:
+            return False
+
+        logger.info(f"Worker {self.worker_id} leased {job.kind} job {job.id} (attempt {job.attempts})")
+        stop = threading.Event()
+        beat = threading.Thread(target=self._heartbeat, args=(job, stop), daemon=True)
+        beat.start()
+        try:
+            result = self._process(job)
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            self.queue.fail(job.id, self.worker_id, repr(e))
+        else:
+            if not self.queue.complete(job.id, self.worker_id, result):
+                logger.warning(f"Lease on job {job.id} was lost; result discarded")
+        finally:
+            stop.set()
+            beat.join()
+        return True
+
+    def _heartbeat(self, job: Job, stop: threading.Event):
+        while not stop.wait(self.heartbeat_seconds):
+            if not self.queue.heartbeat(job.id, self.worker_id, self.lease_seconds):
+                logger.warning(f"Lost lease on job {job.id}")
+                return
+
+    def _process(self, job: Job) -> Dict[str, Any]:
+        if job.kind == "task":
+            task = ResearchTaskSpec.model_validate(job.payload["task"])
+            evidences, metrics = self.flow.execute_task(task)
+            return {"evidence": dump_evidence_json(to_records(evidences)).decode("utf-8"), "metrics": metrics}
+        if job.kind == "request":
+            payload = job.payload
+            self.flow.profile = payload.get("profile", False)
+            horizon, risk_profile = payload.get("horizon", "1m"), payload.get("risk_profile", "normal")
+            if payload.get("run_id"):
+                # A retried request picks up the checkpoints of the attempt that died
+                run_dir = self.flow.run_or_resume(payload["ticker"], horizon, risk_profile, payload["run_id"])
+            else:
+                run_dir = self.flow.run(payload["ticker"], horizon, risk_profile)
+            # Runs that lost tasks to crew errors or timeouts still complete; the caller marks them partial
+            return {"run_dir": run_dir, "failed_tasks": self.flow.failed_tasks, "timed_out_tasks": self.flow.timed_out_tasks}
+        raise ValueError(f"Unknown job kind: {job.kind}")
@@ -9,6 +9,8 @@ class ResearchTaskSpec(BaseModel):
     inputs: Dict[str, Any]
     depends_on: List[str] = []
     parallelizable: bool = False
+    origin: str = "base"  # base|trigger
+    model: Optional[str] = None
 
 class ResearchPlan(BaseModel):
     tasks: List[ResearchTaskSpec]
@@ -32,6 +32,7 @@ class VerdictReport(BaseModel):
     research_plan: ResearchPlan
     evidence: List[Evidence]
     verdict: Verdict
+    confidence: Optional[float] = None
     rationale: Dict[str, str]  # e.g., Keys: "bull_case", "bear_case", with citations
     risks: List[str]
     next_actions: List[str]
@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from src.utils.config import load_config
+
+class DataProvider(ABC):
+    """
+    Source of OHLCV bars and news articles behind `fetch_prices` / `fetch_news`.
+    """
+
+    @abstractmethod
+    def get_prices(self, ticker: str, days: int = 30, end: Optional[date] = None) -> List[Dict[str, Any]]:
+        """
+        Returns the last `days` bars up to and including `end`, oldest first.
+        """
+
+    @abstractmethod
+    def get_news(self, ticker: str, days: int = 7, end: Optional[date] = None) -> List[Dict[str, Any]]:
+        """
+        Returns articles dated within the `days` calendar days ending at `end`.
+        """
+
+_PROVIDER: Optional[DataProvider] = None
+_CONFIGURED = False
+
+def set_data_provider(provider: Optional[DataProvider]):
+    """
+    Installs `provider` process-wide; `None` falls back to the built-in mocks.
+    """
+    global _PROVIDER, _CONFIGURED
+    _PROVIDER = provider
+    _CONFIGURED = True
+
+def get_data_provider() -> Optional[DataProvider]:
+    global _PROVIDER, _CONFIGURED
+    if not _CONFIGURED:
+        storage = load_config("storage")
+        if storage.get("data_provider", "mock") == "local":
+            from .local_data import LocalDataProvider
+            _PROVIDER = LocalDataProvider(storage.get("local_data_dir", "data/local"))
+        _CONFIGURED = True
+    return _PROVIDER
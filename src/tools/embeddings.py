@@ -0,0 +1,168 @@
+import hashlib
+import math
+import os
+import re
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from array import array
+from typing import Dict, List, Optional
+
+from src.utils.config import load_config
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+class Embedder(ABC):
+    """
+    Turns texts into L2-normalized vectors. `name` identifies the model in the
+    embedding cache, so vectors from different models never mix.
+    """
+
+    name = "embedder"
+    dim = 0
+
+    @abstractmethod
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        ...
+
+def _normalize(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(v * v for v in vector))
+    return [v / norm for v in vector] if norm else vector
+
+class HashingEmbedder(Embedder):
+    """
+    Deterministic local stand-in: signed feature hashing of words and word
+    pairs. Captures lexical overlap only, which is enough for tests and offline runs.
+    """
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        vectors = []
+        for text in texts:
+            tokens = _TOKEN.findall(text.lower())
+            vector = [0.0] * self.dim
+            for feature in tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]:
+                h = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+                vector[h % self.dim] += 1.0 if (h >> 63) & 1 else -1.0
+            vectors.append(_normalize(vector))
+        return vectors
+
+class OpenAIEmbedder(Embedder):
+    """
+    Calls an OpenAI-compatible /embeddings endpoint over httpx.
+    """
+
+    def __init__(self, model: str, api_key: Optional[str] = None, base_url: Optional[str] = None, batch_size: int = 256):
+        self.model = model
+        self.name = model
+        self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
+        self.base_url = (base_url or os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1")).rstrip("/")
+        self.batch_size = batch_size
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        import httpx
+
+        if not self.api_key:
+            raise RuntimeError("OPENAI_API_KEY is not set; use embedding_provider: \"hashing\" for offline runs")
+        vectors: List[List[float]] = []
+        with httpx.Client(timeout=30) as client:
+            for start in range(0, len(texts), self.batch_size):
+                response = client.post(
+                    f"{self.base_url}/embeddings",
+                    headers={"Authorization": f"Bearer {self.api_key}"},
+                    json={"model": self.model, "input": texts[start:start + self.batch_size]},
+                )
+                response.raise_for_status()
+                data = sorted(response.json()["data"], key=lambda item: item["index"])
+                vectors.extend(_normalize(item["embedding"]) for item in data)
+        if vectors:
+            self.dim = len(vectors[0])
+        return vectors
+
+class EmbeddingCache:
+    """
+    Persistent (model, text digest) -> float32 vector cache so a claim is only
+    embedded once across runs.
+    """
+
+    def __init__(self, path: str):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (model TEXT NOT NULL, digest TEXT NOT NULL, vector BLOB NOT NULL, "
+            "PRIMARY KEY (model, digest)) WITHOUT ROWID"
+        )
+
+    def get_many(self, model: str, digests: List[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            for start in range(0, len(digests), 500):
+                chunk = digests[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT digest, vector FROM embeddings WHERE model = ? AND digest IN ({placeholders})", [model, *chunk]
+                ).fetchall()
+                for digest, blob in rows:
+                    found[digest] = array("f", blob).tolist()
+        return found
+
+    def put_many(self, model: str, vectors: Dict[str, List[float]]):
+        rows = [(model, digest, array("f", vector).tobytes()) for digest, vector in vectors.items()]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR IGNORE INTO embeddings VALUES (?, ?, ?)", rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+class CachedEmbedder(Embedder):
+    """
+    Wraps an embedder with an EmbeddingCache; only unseen texts reach the model.
+    """
+
+    def __init__(self, embedder: Embedder, cache: EmbeddingCache):
+        self.embedder = embedder
+        self.cache = cache
+        self.name = embedder.name
+        self.dim = embedder.dim
+        self.misses = 0
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        digests = [hashlib.sha1(text.encode("utf-8")).hexdigest() for text in texts]
+        known = self.cache.get_many(self.name, list(set(digests)))
+
+        missing: Dict[str, str] = {}
+        for digest, text in zip(digests, texts):
+            if digest not in known and digest not in missing:
+                missing[digest] = text
+        if missing:
+            computed = dict(zip(missing, self.embedder.embed(list(missing.values()))))
+            self.cache.put_many(self.name, computed)
+            known.update(computed)
+            self.misses += len(missing)
+            self.dim = self.embedder.dim
+        return [known[digest] for digest in digests]
+
+def make_embedder(model_config: Optional[Dict] = None, cache_path: Optional[str] = None) -> Embedder:
+    """
+    Builds the configured embedder (`embedding_provider` in configs/model.yaml),
+    wrapped in the persistent cache unless `cache_path` is empty.
+    """
+    model_config = model_config if model_config is not None else load_config("model")
+    provider = model_config.get("embedding_provider", "hashing")
+    if provider == "hashing":
+        embedder: Embedder = HashingEmbedder(model_config.get("embedding_dim", 256))
+    elif provider == "openai":
+        embedder = OpenAIEmbedder(model_config.get("embedding_model", "text-embedding-3-small"))
+    else:
+        raise ValueError(f"Unknown embedding provider: {provider}")
+
+    if cache_path is None:
+        cache_path = load_config("storage").get("embedding_cache_path", "data/embeddings.db")
+    return CachedEmbedder(embedder, EmbeddingCache(cache_path)) if cache_path else embedder
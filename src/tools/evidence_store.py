@@ -0,0 +1,217 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.schemas.evidence import Evidence
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS evidence (
+    id TEXT PRIMARY KEY,
+    run_id TEXT,
+    ticker TEXT NOT NULL,
+    crew TEXT,
+    task TEXT,
+    source_type TEXT NOT NULL,
+    source_ref TEXT,
+    claim TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    timestamp TEXT NOT NULL,
+    raw_snippet TEXT,
+    tags TEXT NOT NULL,
+    inputs_hash TEXT
+);
+CREATE TABLE IF NOT EXISTS evidence_tags (
+    tag TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    evidence_id TEXT NOT NULL,
+    PRIMARY KEY (tag, ticker, timestamp, evidence_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS crew_latency (
+    crew TEXT PRIMARY KEY,
+    latency_ms REAL NOT NULL,
+    samples INTEGER NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_evidence_ticker_ts ON evidence (ticker, timestamp);
+CREATE INDEX IF NOT EXISTS idx_evidence_ticker_source ON evidence (ticker, source_type, timestamp);
+CREATE INDEX IF NOT EXISTS idx_evidence_confidence ON evidence (ticker, confidence);
+CREATE INDEX IF NOT EXISTS idx_evidence_reuse ON evidence (ticker, crew, task, inputs_hash, timestamp);
+"""
+
+_COLUMNS = "id, run_id, ticker, crew, task, source_type, source_ref, claim, confidence, timestamp, raw_snippet, tags, inputs_hash"
+
+def inputs_digest(inputs: Dict[str, Any]) -> str:
+    """
+    Stable digest of a task's inputs; evidence is only reused for identical inputs.
+    """
+    return hashlib.sha1(json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+def _ts(value: datetime) -> str:
+    # Stored as naive UTC with fixed precision so text ordering matches time ordering
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat(timespec="microseconds")
+
+class EvidenceStore:
+    """
+    Local SQLite store of every Evidence item produced across runs, indexed by
+    ticker, tag, source_type, confidence and timestamp.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def add(self, evidences: Iterable[Evidence], ticker: str, run_id: Optional[str] = None,
+            crew: Optional[str] = None, task: Optional[str] = None, inputs_hash: Optional[str] = None) -> int:
+        rows = []
+        tag_rows = []
+        for ev in evidences:
+            ts = _ts(ev.timestamp)
+            rows.append((
+                ev.id, run_id, ticker, crew, task, ev.source_type, ev.source_ref,
+                ev.claim, ev.confidence, ts, ev.raw_snippet, json.dumps(ev.tags), inputs_hash
+            ))
+            tag_rows.extend((tag, ticker, ts, ev.id) for tag in set(ev.tags))
+
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                f"INSERT OR IGNORE INTO evidence ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            inserted = self._conn.total_changes - before
+            self._conn.executemany("INSERT OR IGNORE INTO evidence_tags VALUES (?, ?, ?, ?)", tag_rows)
+        return inserted
+
+    def query(
+        self,
+        ticker: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        source_type: Optional[str] = None,
+        min_confidence: Optional[float] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        crew: Optional[str] = None,
+        task: Optional[str] = None,
+        run_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Evidence]:
+        """
+        Returns evidence matching every given filter, newest first.
+        `tags` matches items carrying all of the listed tags.
+        """
+        clauses = []
+        params: list = []
+
+        if ticker is not None:
+            clauses.append("e.ticker = ?")
+            params.append(ticker)
+        if source_type is not None:
+            clauses.append("e.source_type = ?")
+            params.append(source_type)
+        if min_confidence is not None:
+            clauses.append("e.confidence >= ?")
+            params.append(min_confidence)
+        if since is not None:
+            clauses.append("e.timestamp >= ?")
+            params.append(_ts(since))
+        if until is not None:
+            clauses.append("e.timestamp <= ?")
+            params.append(_ts(until))
+        if crew is not None:
+            clauses.append("e.crew = ?")
+            params.append(crew)
+        if task is not None:
+            clauses.append("e.task = ?")
+            params.append(task)
+        if run_id is not None:
+            clauses.append("e.run_id = ?")
+            params.append(run_id)
+        for tag in tags or []:
+            sub = "e.id IN (SELECT evidence_id FROM evidence_tags WHERE tag = ?"
+            params.append(tag)
+            if ticker is not None:
+                sub += " AND ticker = ?"
+                params.append(ticker)
+            if since is not None:
+                sub += " AND timestamp >= ?"
+                params.append(_ts(since))
+            clauses.append(sub + ")")
+
+        sql = "SELECT e.id, e.source_type, e.source_ref, e.claim, e.confidence, e.timestamp, e.raw_snippet, e.tags FROM evidence e"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY e.timestamp DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._to_evidence(row) for row in rows]
+
+    def find_reusable(self, ticker: str, crew: str, task: str, max_age: timedelta, inputs_hash: str) -> List[Evidence]:
+        """
+        Returns the evidence of the most recent run of `task` on `crew` for this
+        ticker with the same inputs if it is younger than `max_age`, otherwise
+        an empty list.
+        """
+        since = _ts(datetime.utcnow() - max_age)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT run_id FROM evidence WHERE ticker = ? AND crew = ? AND task = ? AND inputs_hash = ? AND timestamp >= ? "
+                "ORDER BY timestamp DESC LIMIT 1",
+                (ticker, crew, task, inputs_hash, since),
+            ).fetchone()
+        if row is None:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, source_type, source_ref, claim, confidence, timestamp, raw_snippet, tags FROM evidence "
+                "WHERE ticker = ? AND crew = ? AND task = ? AND inputs_hash = ? AND run_id IS ? ORDER BY timestamp DESC",
+                (ticker, crew, task, inputs_hash, row[0]),
+            ).fetchall()
+        return [self._to_evidence(r) for r in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def record_latency(self, crew: str, latency_ms: float):
+        """
+        Folds one observed task latency into the crew's moving average.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO crew_latency VALUES (?, ?, 1, ?) ON CONFLICT(crew) DO UPDATE SET "
+                "latency_ms = 0.8 * latency_ms + 0.2 * excluded.latency_ms, samples = samples + 1, updated_at = excluded.updated_at",
+                (crew, latency_ms, _ts(datetime.utcnow())),
+            )
+
+    def crew_latencies(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._conn.execute("SELECT crew, latency_ms FROM crew_latency").fetchall())
+
+    @staticmethod
+    def _to_evidence(row) -> Evidence:
+        return Evidence(
+            id=row[0],
+            source_type=row[1],
+            source_ref=row[2] or "",
+            claim=row[3],
+            confidence=row[4],
+            timestamp=datetime.fromisoformat(row[5]),
+            raw_snippet=row[6],
+            tags=json.loads(row[7]),
+        )
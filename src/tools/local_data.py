@@ -0,0 +1,278 @@
+import bisect
+import csv
+import hashlib
+import json
+import mmap
+import os
+import threading
+from array import array
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .data_provider import DataProvider
+
+# Price files: 16-byte header (magic, bar count) followed by six native-endian
+# 8-byte columns: date ordinal (int64), open, high, low, close, volume (float64).
+BARS_MAGIC = b"AIBARS1\x00"
+# News index files: header, then date ordinals (int64[n]) and line offsets
+# (int64[n + 1]) into the date-sorted <TICKER>.jsonl corpus.
+NEWS_INDEX_MAGIC = b"AINEWS1\x00"
+HEADER_SIZE = 16
+PRICE_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+def _to_ordinal(value: Any) -> int:
+    if isinstance(value, date):
+        return value.toordinal()
+    return date.fromisoformat(str(value)[:10]).toordinal()
+
+class PriceBars:
+    """
+    Zero-copy view over a contiguous range of a ticker's memory-mapped bars.
+    """
+
+    __slots__ = ("dates", "open", "high", "low", "close", "volume")
+
+    def __init__(self, dates: memoryview, columns: Dict[str, memoryview]):
+        self.dates = dates
+        self.open = columns["open"]
+        self.high = columns["high"]
+        self.low = columns["low"]
+        self.close = columns["close"]
+        self.volume = columns["volume"]
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def slice(self, start: int, stop: int) -> "PriceBars":
+        return PriceBars(self.dates[start:stop], {c: getattr(self, c)[start:stop] for c in PRICE_COLUMNS})
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "date": date.fromordinal(self.dates[i]).isoformat(),
+                "open": self.open[i],
+                "high": self.high[i],
+                "low": self.low[i],
+                "close": self.close[i],
+                "volume": self.volume[i],
+            }
+            for i in range(len(self.dates))
+        ]
+
+class _MappedFile:
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        self.map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.map)
+
+    def column(self, offset: int, count: int, fmt: str) -> memoryview:
+        return self.view[offset:offset + 8 * count].cast(fmt)
+
+    def close(self):
+        self.view.release()
+        self.map.close()
+        self._file.close()
+
+class LocalDataProvider(DataProvider):
+    """
+    Offline provider reading per-ticker memory-mapped bar files and an indexed
+    news corpus built by `ingest_prices_csv` / `ingest_news_jsonl`. Date range
+    lookups are binary searches over the mapped date column.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._lock = threading.Lock()
+        self._bars: Dict[str, Optional[PriceBars]] = {}
+        self._news: Dict[str, Optional[Tuple[memoryview, memoryview, _MappedFile]]] = {}
+        self._files: List[_MappedFile] = []
+
+    def _open(self, path: str) -> _MappedFile:
+        mapped = _MappedFile(path)
+        self._files.append(mapped)
+        return mapped
+
+    def _ticker_bars(self, ticker: str) -> Optional[PriceBars]:
+        with self._lock:
+            if ticker not in self._bars:
+                path = os.path.join(self.root, "prices", f"{ticker}.bars")
+                if not os.path.exists(path) or os.path.getsize(path) < HEADER_SIZE:
+                    self._bars[ticker] = None
+                else:
+                    mapped = self._open(path)
+                    if mapped.map[:8] != BARS_MAGIC:
+                        raise ValueError(f"{path} is not a bars file")
+                    n = mapped.column(8, 1, "q")[0]
+                    offset = HEADER_SIZE
+                    dates = mapped.column(offset, n, "q")
+                    columns = {}
+                    for i, name in enumerate(PRICE_COLUMNS):
+                        columns[name] = mapped.column(offset + 8 * n * (i + 1), n, "d")
+                    self._bars[ticker] = PriceBars(dates, columns)
+            return self._bars[ticker]
+
+    def get_bars(self, ticker: str, start: Optional[date] = None, end: Optional[date] = None) -> Optional[PriceBars]:
+        """
+        Returns the bars dated within [start, end] as zero-copy column slices.
+        """
+        bars = self._ticker_bars(ticker)
+        if bars is None:
+            return None
+        lo = bisect.bisect_left(bars.dates, start.toordinal()) if start else 0
+        hi = bisect.bisect_right(bars.dates, end.toordinal()) if end else len(bars)
+        return bars.slice(lo, hi)
+
+    def get_prices(self, ticker: str, days: int = 30, end: Optional[date] = None) -> List[Dict[str, Any]]:
+        bars = self.get_bars(ticker, end=end)
+        if bars is None:
+            return []
+        return bars.slice(max(len(bars) - days, 0), len(bars)).to_records()
+
+    def _ticker_news(self, ticker: str):
+        with self._lock:
+            if ticker not in self._news:
+                index_path = os.path.join(self.root, "news", f"{ticker}.idx")
+                corpus_path = os.path.join(self.root, "news", f"{ticker}.jsonl")
+                # Both files are needed; an empty corpus cannot be mapped
+                if (not os.path.exists(index_path) or not os.path.exists(corpus_path)
+                        or os.path.getsize(index_path) < HEADER_SIZE or not os.path.getsize(corpus_path)):
+                    self._news[ticker] = None
+                else:
+                    index = self._open(index_path)
+                    if index.map[:8] != NEWS_INDEX_MAGIC:
+                        raise ValueError(f"{index_path} is not a news index")
+                    n = index.column(8, 1, "q")[0]
+                    dates = index.column(HEADER_SIZE, n, "q")
+                    offsets = index.column(HEADER_SIZE + 8 * n, n + 1, "q")
+                    self._news[ticker] = (dates, offsets, self._open(corpus_path))
+            return self._news[ticker]
+
+    def get_news(self, ticker: str, days: int = 7, end: Optional[date] = None) -> List[Dict[str, Any]]:
+        news = self._ticker_news(ticker)
+        if news is None:
+            return []
+        dates, offsets, corpus = news
+        end_ordinal = end.toordinal() if end else dates[-1] if len(dates) else 0
+        lo = bisect.bisect_left(dates, end_ordinal - days + 1)
+        hi = bisect.bisect_right(dates, end_ordinal)
+        if lo >= hi:
+            return []
+        block = corpus.map[offsets[lo]:offsets[hi]]
+        return [json.loads(line) for line in block.splitlines() if line]
+
+    def close(self):
+        with self._lock:
+            self._bars.clear()
+            self._news.clear()
+            for mapped in self._files:
+                try:
+                    mapped.close()
+                except BufferError:
+                    # A caller still holds a zero-copy slice; the map is released with it
+                    pass
+            self._files.clear()
+
+def _atomic_write(path: str, chunks: Iterable[bytes]):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp, path)
+
+def _read_existing_bars(path: str) -> Dict[int, Tuple[float, ...]]:
+    if not os.path.exists(path):
+        return {}
+    mapped = _MappedFile(path)
+    try:
+        n = mapped.column(8, 1, "q")[0]
+        dates = mapped.column(HEADER_SIZE, n, "q")
+        columns = [mapped.column(HEADER_SIZE + 8 * n * (i + 1), n, "d") for i in range(len(PRICE_COLUMNS))]
+        rows = {dates[j]: tuple(col[j] for col in columns) for j in range(n)}
+        for col in columns:
+            col.release()
+        dates.release()
+        return rows
+    finally:
+        mapped.close()
+
+def ingest_prices_csv(csv_path: str, root: str, ticker: Optional[str] = None) -> Dict[str, int]:
+    """
+    Builds `<root>/prices/<TICKER>.bars` from a CSV with date, open, high, low,
+    close, volume columns (plus `ticker`, unless given). Rows are merged into any
+    existing file; the last row for a date wins. Returns bar counts per ticker.
+    """
+    incoming: Dict[str, Dict[int, Tuple[float, ...]]] = {}
+    with open(csv_path, "r", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            symbol = ticker or row["ticker"]
+            close = float(row["close"])
+            incoming.setdefault(symbol, {})[_to_ordinal(row["date"])] = (
+                float(row.get("open") or close),
+                float(row.get("high") or close),
+                float(row.get("low") or close),
+                close,
+                float(row.get("volume") or 0.0),
+            )
+
+    counts = {}
+    for symbol, rows in incoming.items():
+        path = os.path.join(root, "prices", f"{symbol}.bars")
+        merged = _read_existing_bars(path)
+        merged.update(rows)
+        ordered = sorted(merged)
+
+        header = BARS_MAGIC + array("q", [len(ordered)]).tobytes()
+        chunks = [header, array("q", ordered).tobytes()]
+        for i in range(len(PRICE_COLUMNS)):
+            chunks.append(array("d", (merged[d][i] for d in ordered)).tobytes())
+        _atomic_write(path, chunks)
+        counts[symbol] = len(ordered)
+    return counts
+
+def _article_key(article: Dict[str, Any]) -> Tuple[int, str]:
+    # Same day and same url (or title, or failing both, the same content) is the same article
+    ident = article.get("url") or article.get("title")
+    if not ident:
+        ident = hashlib.sha1(json.dumps(article, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    return _to_ordinal(article["date"]), ident
+
+def ingest_news_jsonl(jsonl_path: str, root: str) -> Dict[str, int]:
+    """
+    Builds `<root>/news/<TICKER>.jsonl` (sorted by date) and its binary date/offset
+    index from a JSONL file of articles carrying `ticker` and `date`. Articles are
+    merged into any existing corpus; the last copy of an article (same date and
+    url or title) wins. Returns article counts per ticker.
+    """
+    incoming: Dict[str, List[Dict[str, Any]]] = {}
+    with open(jsonl_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                article = json.loads(line)
+                incoming.setdefault(article["ticker"], []).append(article)
+
+    counts = {}
+    for symbol, articles in incoming.items():
+        corpus_path = os.path.join(root, "news", f"{symbol}.jsonl")
+        merged: Dict[Tuple[int, str], Dict[str, Any]] = {}
+        if os.path.exists(corpus_path):
+            with open(corpus_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        existing = json.loads(line)
+                        merged[_article_key(existing)] = existing
+        for article in articles:
+            merged[_article_key(article)] = article
+        articles = sorted(merged.values(), key=lambda a: _to_ordinal(a["date"]))
+
+        lines = [(json.dumps(a, default=str) + "\n").encode("utf-8") for a in articles]
+        offsets = array("q", [0])
+        for encoded in lines:
+            offsets.append(offsets[-1] + len(encoded))
+        dates = array("q", (_to_ordinal(a["date"]) for a in articles))
+
+        _atomic_write(corpus_path, lines)
+        header = NEWS_INDEX_MAGIC + array("q", [len(articles)]).tobytes()
+        _atomic_write(os.path.join(root, "news", f"{symbol}.idx"), [header, dates.tobytes(), offsets.tobytes()])
+        counts[symbol] = len(articles)
+    return counts
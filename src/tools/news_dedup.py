@@ -0,0 +1,177 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+SIGNATURE_BITS = 64
+_TOKEN = re.compile(r"[a-z0-9]+")
+_MASK = (1 << SIGNATURE_BITS) - 1
+
+def _article_text(article: Dict[str, Any]) -> str:
+    return f"{article.get('title', '')} {article.get('snippet', '')}"
+
+def _normalize(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower())
+
+def simhash(text: str, shingle: int = 1) -> int:
+    """
+    64-bit SimHash over word shingles; near-duplicate texts differ in few bits.
+    Single words work best for headline-length text.
+    """
+    tokens = _normalize(text)
+    if not tokens:
+        return 0
+    features = [" ".join(tokens[i:i + shingle]) for i in range(max(len(tokens) - shingle + 1, 1))]
+
+    weights = [0] * SIGNATURE_BITS
+    for feature in features:
+        h = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+        for bit in range(SIGNATURE_BITS):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+
+    signature = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            signature |= 1 << bit
+    return signature
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+class SignatureCache:
+    """
+    Persistent digest -> SimHash cache so an article seen in any earlier run is
+    never re-shingled.
+    """
+
+    def __init__(self, path: str):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS signatures (digest TEXT PRIMARY KEY, signature INTEGER NOT NULL, first_seen TEXT NOT NULL)"
+        )
+
+    def get_many(self, digests: List[str]) -> Dict[str, int]:
+        found: Dict[str, int] = {}
+        with self._lock:
+            for start in range(0, len(digests), 500):
+                chunk = digests[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT digest, signature FROM signatures WHERE digest IN ({placeholders})", chunk
+                ).fetchall()
+                # SQLite integers are signed; signatures are stored in two's complement
+                found.update((digest, signature & _MASK) for digest, signature in rows)
+        return found
+
+    def put_many(self, signatures: Dict[str, int]):
+        now = datetime.utcnow().isoformat()
+        rows = [
+            (digest, sig - (1 << SIGNATURE_BITS) if sig >= 1 << (SIGNATURE_BITS - 1) else sig, now)
+            for digest, sig in signatures.items()
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR IGNORE INTO signatures VALUES (?, ?, ?)", rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+
+class NewsDeduplicator:
+    """
+    Streams articles into near-duplicate clusters and keeps one representative
+    per cluster, annotated with `cluster_size`.
+
+    Signatures are split into `bands` bit ranges; any two signatures within
+    `max_distance` bits share at least one identical band when
+    `max_distance < bands`, so each article is only compared against clusters
+    in its own band buckets and clustering stays roughly linear.
+    """
+
+    def __init__(self, cache: Optional[SignatureCache] = None, max_distance: int = 7, bands: int = 8):
+        if max_distance >= bands:
+            raise ValueError("max_distance must be smaller than bands for exact band lookups")
+        self.cache = cache
+        self.max_distance = max_distance
+        self.bands = bands
+        self.band_bits = SIGNATURE_BITS // bands
+
+    def signatures(self, articles: List[Dict[str, Any]]) -> List[int]:
+        digests = [hashlib.sha1(" ".join(_normalize(_article_text(a))).encode("utf-8")).hexdigest() for a in articles]
+        known = self.cache.get_many(list(set(digests))) if self.cache is not None else {}
+
+        computed: Dict[str, int] = {}
+        result = []
+        for article, digest in zip(articles, digests):
+            if digest in known:
+                result.append(known[digest])
+            else:
+                if digest not in computed:
+                    computed[digest] = simhash(_article_text(article))
+                result.append(computed[digest])
+        if self.cache is not None and computed:
+            self.cache.put_many(computed)
+        return result
+
+    def _band_keys(self, signature: int) -> Iterable[tuple]:
+        band_mask = (1 << self.band_bits) - 1
+        for band in range(self.bands):
+            yield band, (signature >> (band * self.band_bits)) & band_mask
+
+    def cluster(self, articles: List[Dict[str, Any]], signatures: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+        """
+        Returns one representative per cluster, in first-seen order. Pass
+        `signatures` to reuse ones computed earlier for the same articles.
+        """
+        representatives: List[Dict[str, Any]] = []
+        rep_signatures: List[int] = []
+        buckets: Dict[tuple, List[int]] = {}
+
+        if signatures is None:
+            signatures = self.signatures(articles)
+        for article, signature in zip(articles, signatures):
+            match = None
+            keys = list(self._band_keys(signature))
+            for key in keys:
+                for idx in buckets.get(key, ()):
+                    if hamming(signature, rep_signatures[idx]) <= self.max_distance:
+                        match = idx
+                        break
+                if match is not None:
+                    break
+
+            if match is not None:
+                representatives[match]["cluster_size"] += 1
+                continue
+
+            rep = dict(article)
+            rep["cluster_size"] = 1
+            rep["cluster_id"] = f"{signature:016x}"
+            representatives.append(rep)
+            rep_signatures.append(signature)
+            for key in keys:
+                buckets.setdefault(key, []).append(len(representatives) - 1)
+
+        return representatives
+
+def weighted_sentiment(stories: List[Dict[str, Any]]) -> Optional[float]:
+    """
+    Mean article sentiment (positive=+1, negative=-1, otherwise 0) weighted by
+    cluster size, or None when no story carries a sentiment label.
+    """
+    total = 0.0
+    weight = 0
+    for story in stories:
+        label = story.get("sentiment")
+        if label is None:
+            continue
+        size = story.get("cluster_size", 1)
+        total += size * (1.0 if label == "positive" else -1.0 if label == "negative" else 0.0)
+        weight += size
+    return total / weight if weight else None
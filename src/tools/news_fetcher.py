@@ -1,7 +1,19 @@
-from datetime import datetime, timedelta
-from typing import List, Dict
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Optional
 
-def fetch_news(ticker: str, days: int = 7) -> List[Dict[str, str]]:
+from .data_provider import get_data_provider
+
+def fetch_news(ticker: str, days: int = 7, end: Optional[date] = None) -> List[Dict[str, str]]:
+    """
+    Returns articles from the last `days` days up to `end` from the configured data
+    provider, or deterministic mock articles when no provider is configured.
+    """
+    provider = get_data_provider()
+    if provider is not None:
+        return provider.get_news(ticker, days, end)
+    return mock_news(ticker, days, end)
+
+def mock_news(ticker: str, days: int = 7, end: Optional[date] = None) -> List[Dict[str, str]]:
     """
     Returns deterministic mock news articles.
     """
@@ -16,7 +28,7 @@ def fetch_news(ticker: str, days: int = 7) -> List[Dict[str, str]]:
     # Deterministic selection based on ticker
     seed = sum(ord(c) for c in ticker)
     selected = []
-    current_date = datetime.now()
+    current_date = datetime.combine(end, datetime.min.time()) if end else datetime.now()
     
     for i, article in enumerate(mock_articles):
         # Rotate through articles based on ticker seed
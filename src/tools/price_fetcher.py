@@ -1,8 +1,20 @@
 import random
-from datetime import datetime, timedelta
-from typing import List, Dict
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Optional
 
-def fetch_prices(ticker: str, days: int = 30) -> List[Dict[str, float]]:
+from .data_provider import get_data_provider
+
+def fetch_prices(ticker: str, days: int = 30, end: Optional[date] = None) -> List[Dict[str, float]]:
+    """
+    Returns the last `days` OHLC bars up to `end` from the configured data provider,
+    or a deterministic mock series when no provider is configured.
+    """
+    provider = get_data_provider()
+    if provider is not None:
+        return provider.get_prices(ticker, days, end)
+    return mock_prices(ticker, days, end)
+
+def mock_prices(ticker: str, days: int = 30, end: Optional[date] = None) -> List[Dict[str, float]]:
     """
     Returns a deterministic mock OHLC series based on the ticker.
     """
@@ -11,7 +23,8 @@ def fetch_prices(ticker: str, days: int = 30) -> List[Dict[str, float]]:
     
     prices = []
     base_price = 100.0 + (seed % 50)
-    current_date = datetime.now() - timedelta(days=days)
+    end_date = datetime.combine(end, datetime.min.time()) if end else datetime.now()
+    current_date = end_date - timedelta(days=days)
     
     for _ in range(days):
         # Increased volatility range to ensures trigger firing for QA
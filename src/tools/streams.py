@@ -0,0 +1,104 @@
+import json
+import random
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional
+
+from .news_fetcher import mock_news
+
+@dataclass
+class StreamEvent:
+    kind: str  # bar|news
+    ticker: str
+    data: Dict[str, Any] = field(default_factory=dict)
+
+class StreamSource(ABC):
+    """
+    Pluggable source of incoming bars and articles for watch mode.
+    """
+
+    @abstractmethod
+    def events(self) -> Iterator[StreamEvent]:
+        ...
+
+    def close(self):
+        pass
+
+def _parse_line(line: str) -> Optional[StreamEvent]:
+    record = json.loads(line)
+    kind = record.pop("type", "bar")
+    ticker = record.pop("ticker", None)
+    if ticker is None or kind not in ("bar", "news"):
+        return None
+    return StreamEvent(kind, ticker, record)
+
+class FileTailSource(StreamSource):
+    """
+    Follows a JSONL file like `tail -f`. Each line is
+    {"type": "bar", "ticker": ..., "date": ..., "close": ...} or
+    {"type": "news", "ticker": ..., "title": ..., "snippet": ...}.
+    """
+
+    def __init__(self, path: str, follow: bool = True, from_start: bool = True, poll_seconds: float = 0.5):
+        self.path = path
+        self.follow = follow
+        self.from_start = from_start
+        self.poll_seconds = poll_seconds
+        self._closed = False
+
+    def events(self) -> Iterator[StreamEvent]:
+        with open(self.path, "r", encoding="utf-8") as f:
+            if not self.from_start:
+                f.seek(0, 2)
+            partial = ""
+            while not self._closed:
+                line = f.readline()
+                if not line:
+                    if not self.follow:
+                        return
+                    time.sleep(self.poll_seconds)
+                    continue
+                if not line.endswith("\n"):
+                    # The writer has not finished this line yet
+                    partial += line
+                    continue
+                line, partial = partial + line, ""
+                if line.strip():
+                    event = _parse_line(line)
+                    if event is not None:
+                        yield event
+
+    def close(self):
+        self._closed = True
+
+class MockStreamSource(StreamSource):
+    """
+    Deterministic random-walk bars for every ticker on each tick, with the
+    occasional mock article mixed in.
+    """
+
+    def __init__(self, tickers: List[str], ticks: int = 100, news_probability: float = 0.02, seed: int = 0,
+                 interval_seconds: float = 0.0):
+        self.tickers = tickers
+        self.ticks = ticks
+        self.news_probability = news_probability
+        self.seed = seed
+        self.interval_seconds = interval_seconds
+
+    def events(self) -> Iterator[StreamEvent]:
+        rng = random.Random(self.seed)
+        closes = {t: 100.0 + sum(ord(c) for c in t) % 50 for t in self.tickers}
+        articles = {t: mock_news(t) for t in self.tickers}
+        start = datetime.now() - timedelta(days=self.ticks)
+
+        for tick in range(self.ticks):
+            day = (start + timedelta(days=tick)).strftime("%Y-%m-%d")
+            for ticker in self.tickers:
+                closes[ticker] = max(closes[ticker] * (1 + rng.gauss(0, 0.02)), 0.01)
+                yield StreamEvent("bar", ticker, {"date": day, "close": round(closes[ticker], 2)})
+                if articles[ticker] and rng.random() < self.news_probability:
+                    yield StreamEvent("news", ticker, {**rng.choice(articles[ticker]), "date": day})
+            if self.interval_seconds:
+                time.sleep(self.interval_seconds)
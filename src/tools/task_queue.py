@@ -0,0 +1,229 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import uuid4
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+# Abandoned by the submitter (timeout, deadline or early stop); never leased again
+CANCELLED = "cancelled"
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    payload: Dict[str, Any]
+    status: str
+    attempts: int
+    max_attempts: int
+    result: Optional[Any] = None
+    error: Optional[str] = None
+
+class TaskQueue(ABC):
+    """
+    Durable job queue shared by the orchestrator and worker processes. Jobs are
+    leased for a limited time; a worker that stops heartbeating loses its lease
+    and the job is handed to another worker until `max_attempts` is reached.
+    """
+
+    @abstractmethod
+    def enqueue(self, kind: str, payload: Dict[str, Any], max_attempts: Optional[int] = None) -> str:
+        ...
+
+    @abstractmethod
+    def lease(self, worker_id: str, kinds: Iterable[str], lease_seconds: float) -> Optional[Job]:
+        ...
+
+    @abstractmethod
+    def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        ...
+
+    @abstractmethod
+    def complete(self, job_id: str, worker_id: str, result: Any) -> bool:
+        ...
+
+    @abstractmethod
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        ...
+
+    @abstractmethod
+    def cancel(self, job_id: str) -> bool:
+        ...
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Job]:
+        ...
+
+    def wait(self, job_ids: List[str], timeout: Optional[float] = None, poll_seconds: float = 0.1) -> Dict[str, Job]:
+        """
+        Blocks until every job is done, failed or cancelled (or `timeout`
+        passes) and returns the finished jobs by id.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        finished: Dict[str, Job] = {}
+        while True:
+            for job_id in job_ids:
+                if job_id not in finished:
+                    job = self.get(job_id)
+                    if job is not None and job.status in (DONE, FAILED, CANCELLED):
+                        finished[job_id] = job
+            if len(finished) == len(job_ids):
+                return finished
+            if deadline is not None and time.monotonic() >= deadline:
+                return finished
+            time.sleep(poll_seconds)
+
+class SQLiteTaskQueue(TaskQueue):
+    """
+    Default backend: a single SQLite file, safe for concurrent processes on
+    one host. WAL mode keeps readers and writers from blocking each other, but
+    its index lives in shared memory that processes on other hosts cannot see.
+
+    With `shared_filesystem`, the file uses a rollback journal instead so
+    workers on several hosts can share it over a network filesystem. That
+    relies on the filesystem's POSIX locks, which many NFS setups do not
+    provide reliably; prefer one queue host otherwise.
+    """
+
+    def __init__(self, path: str, max_attempts: int = 3, shared_filesystem: bool = False):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute(f"PRAGMA journal_mode={'DELETE' if shared_filesystem else 'WAL'}")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL,
+                lease_owner TEXT,
+                lease_expires REAL,
+                result TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (kind, status, created_at);
+            CREATE INDEX IF NOT EXISTS idx_jobs_lease ON jobs (status, lease_expires);
+        """)
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], max_attempts: Optional[int] = None) -> str:
+        job_id = str(uuid4())
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, kind, payload, status, max_attempts, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, kind, json.dumps(payload, default=str), PENDING, max_attempts or self.max_attempts, now, now),
+            )
+        return job_id
+
+    def lease(self, worker_id: str, kinds: Iterable[str], lease_seconds: float) -> Optional[Job]:
+        kinds = list(kinds)
+        placeholders = ",".join("?" * len(kinds))
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Expired leases that used up their attempts are failed rather than retried
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, error = COALESCE(error, 'lease expired'), updated_at = ? "
+                    "WHERE status = ? AND lease_expires < ? AND attempts >= max_attempts",
+                    (FAILED, now, LEASED, now),
+                )
+                row = self._conn.execute(
+                    f"SELECT id, kind, payload, attempts, max_attempts FROM jobs "
+                    f"WHERE kind IN ({placeholders}) AND (status = ? OR (status = ? AND lease_expires < ?)) "
+                    f"ORDER BY created_at LIMIT 1",
+                    (*kinds, PENDING, LEASED, now),
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, lease_owner = ?, lease_expires = ?, attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                    (LEASED, worker_id, now + lease_seconds, now, row[0]),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return Job(id=row[0], kind=row[1], payload=json.loads(row[2]), status=LEASED, attempts=row[3] + 1, max_attempts=row[4])
+
+    def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        now = time.time()
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE jobs SET lease_expires = ?, updated_at = ? WHERE id = ? AND status = ? AND lease_owner = ?",
+                (now + lease_seconds, now, job_id, LEASED, worker_id),
+            )
+        return cur.rowcount == 1
+
+    def complete(self, job_id: str, worker_id: str, result: Any) -> bool:
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, lease_expires = NULL, updated_at = ? WHERE id = ? AND status = ? AND lease_owner = ?",
+                (DONE, json.dumps(result, default=str), time.time(), job_id, LEASED, worker_id),
+            )
+        return cur.rowcount == 1
+
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE jobs SET status = CASE WHEN attempts >= max_attempts THEN ? ELSE ? END, "
+                "error = ?, lease_owner = NULL, lease_expires = NULL, updated_at = ? "
+                "WHERE id = ? AND status = ? AND lease_owner = ?",
+                (FAILED, PENDING, error, time.time(), job_id, LEASED, worker_id),
+            )
+        return cur.rowcount == 1
+
+    def cancel(self, job_id: str) -> bool:
+        # A worker still running the job loses its lease, so its result is discarded
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE jobs SET status = ?, error = 'cancelled', lease_owner = NULL, lease_expires = NULL, updated_at = ? "
+                "WHERE id = ? AND status IN (?, ?)",
+                (CANCELLED, time.time(), job_id, PENDING, LEASED),
+            )
+        return cur.rowcount == 1
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, kind, payload, status, attempts, max_attempts, result, error, lease_expires FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        status = row[3]
+        if status == LEASED and row[8] is not None and row[8] < time.time() and row[4] >= row[5]:
+            # Lease ran out on the final attempt; no worker will pick it up again
+            status = FAILED
+        return Job(
+            id=row[0], kind=row[1], payload=json.loads(row[2]), status=status, attempts=row[4], max_attempts=row[5],
+            result=json.loads(row[6]) if row[6] is not None else None, error=row[7] or ("lease expired" if status == FAILED else None),
+        )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+QUEUE_BACKENDS = {
+    "sqlite": SQLiteTaskQueue,
+}
+
+def make_queue(backend: str, path: str, max_attempts: int = 3, shared_filesystem: bool = False) -> TaskQueue:
+    if backend not in QUEUE_BACKENDS:
+        raise ValueError(f"Unknown queue backend: {backend}")
+    return QUEUE_BACKENDS[backend](path, max_attempts=max_attempts, shared_filesystem=shared_filesystem)
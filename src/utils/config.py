@@ -0,0 +1,20 @@
+import yaml
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict
+
+CONFIG_DIR = Path(__file__).resolve().parents[2] / "configs"
+
+@lru_cache(maxsize=None)
+def _read_config(name: str) -> Dict[str, Any]:
+    path = CONFIG_DIR / f"{name}.yaml"
+    if not path.exists():
+        return {}
+    with open(path, "r") as f:
+        return yaml.safe_load(f) or {}
+
+def load_config(name: str) -> Dict[str, Any]:
+    """
+    Loads `configs/<name>.yaml` once per process and returns a copy of it.
+    """
+    return dict(_read_config(name))
@@ -1,7 +1,7 @@
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 def ensure_dir(path: str):
     Path(path).mkdir(parents=True, exist_ok=True)
@@ -11,11 +11,30 @@ def write_json(path: str, data: Any):
     with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, default=str)
 
+def read_json(path: str) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
 def write_text(path: str, content: str):
     ensure_dir(os.path.dirname(path))
     with open(path, "w", encoding="utf-8") as f:
         f.write(content)
 
+def write_bytes(path: str, content: bytes):
+    # Written via a temp file so a killed process never leaves a truncated file behind
+    ensure_dir(os.path.dirname(path))
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+def read_jsonl(path: str) -> List[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        # A process killed mid-append can leave a partial last line
+        return [json.loads(line) for line in f if line.endswith("\n")]
+
 def write_jsonl(path: str, event: Dict[str, Any]):
     ensure_dir(os.path.dirname(path))
     with open(path, "a", encoding="utf-8") as f:
@@ -0,0 +1,322 @@
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from .io import ensure_dir, read_json, write_json, write_text
+
+PROFILE_DIR = "profile"
+# From 3.12 cProfile hooks sys.monitoring, which is process-wide: only one profiler
+# can be enabled at a time and it sees the calls of every thread
+PROCESS_WIDE_CPROFILE = sys.version_info >= (3, 12)
+RUN_PROFILE = "run"
+
+def _frame_label(code) -> str:
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+def _top_functions(stats: pstats.Stats, top_n: int) -> List[Dict[str, Any]]:
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:top_n]
+    return [
+        {
+            "function": f"{os.path.basename(filename)}:{lineno}({name})",
+            "ncalls": nc,
+            "tottime_ms": round(tt * 1000, 3),
+            "cumtime_ms": round(ct * 1000, 3),
+        }
+        for (filename, lineno, name), (cc, nc, tt, ct, callers) in rows
+    ]
+
+class RunProfiler:
+    """
+    Per-run CPU and allocation profiler: each scope (a pipeline stage or a
+    crew task) gets its own cProfile and tracemalloc net/peak counters, and the
+    top allocation sites still alive at the end of the run are listed. With
+    `sample_interval` set, a sampling thread also records collapsed stacks for
+    every thread inside a scope, ready for flamegraph.pl or speedscope, and
+    counts the sampled functions of each scope.
+
+    With `process_wide` (the default from Python 3.12), scopes are not
+    cProfiled; a single profiler covers the whole run instead and per-scope
+    hotspots come from the samples only.
+
+    CPU times are per thread. Memory counters are process-wide, so crews
+    running concurrently see each other's allocations.
+    """
+
+    def __init__(self, output_dir: str, top_n: int = 20, sample_interval: Optional[float] = 0.005, trace_frames: int = 1,
+                 process_wide: Optional[bool] = None):
+        self.output_dir = output_dir
+        self.top_n = top_n
+        self.sample_interval = sample_interval
+        self.trace_frames = trace_frames
+        self.process_wide = PROCESS_WIDE_CPROFILE if process_wide is None else process_wide
+        self.scopes: Dict[str, Dict[str, Any]] = {}
+        self.stacks: Counter = Counter()
+        self.scope_samples: Dict[str, Counter] = {}
+        self._run_profile: Optional[cProfile.Profile] = None
+        self._profiles: Dict[str, pstats.Stats] = {}
+        self._active: Dict[int, List[str]] = {}
+        self._entry_frames: Dict[int, Any] = {}
+        self._profiling_threads = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._started_tracemalloc = False
+        self.alloc_top: List[Dict[str, Any]] = []
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_frames)
+            self._started_tracemalloc = True
+        if self.sample_interval:
+            self._sampler = threading.Thread(target=self._sample_loop, daemon=True)
+            self._sampler.start()
+        if self.process_wide:
+            self._run_profile = cProfile.Profile()
+            try:
+                self._run_profile.enable()
+            except ValueError:
+                # Another tool (a debugger or an outer profiler) already holds the slot
+                self._run_profile = None
+
+    def stop(self):
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        if self._run_profile is not None:
+            self._run_profile.disable()
+            self._profiles[RUN_PROFILE] = pstats.Stats(self._run_profile, stream=io.StringIO())
+            self._run_profile = None
+        if self._started_tracemalloc:
+            # One snapshot per run; diffing snapshots per scope costs more than most crews
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [tracemalloc.Filter(False, path) for path in (__file__, pstats.__file__, tracemalloc.__file__)]
+            )
+            stats = snapshot.statistics("lineno")[:self.top_n]
+            self.alloc_top = [
+                {"site": f"{os.path.basename(s.traceback[0].filename)}:{s.traceback[0].lineno}",
+                 "size_kb": round(s.size / 1024, 2), "count": s.count}
+                for s in stats
+            ]
+            tracemalloc.stop()
+
+    @contextmanager
+    def scope(self, name: str, cpu_profile: bool = True) -> Iterator[None]:
+        """
+        Measures the enclosed block as `name`. Scopes that only wait on work in
+        other threads should pass `cpu_profile=False`; their samples and
+        counters are still recorded.
+        """
+        thread_id = threading.get_ident()
+        with self._lock:
+            if thread_id not in self._active:
+                # The frame holding the outermost `with`; sampled stacks are cut above it
+                self._entry_frames[thread_id] = sys._getframe(2)
+            self._active.setdefault(thread_id, []).append(name)
+            # A thread can only run one cProfile at a time; nested scopes record time and memory only
+            use_cprofile = cpu_profile and not self.process_wide and thread_id not in self._profiling_threads
+            if use_cprofile:
+                self._profiling_threads.add(thread_id)
+
+        # Thread CPU time, so a stage blocked on its crews does not show up as a hotspot
+        profile = cProfile.Profile(time.thread_time) if use_cprofile else None
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            start_mem = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        start_wall = time.perf_counter()
+        start_cpu = time.thread_time()
+        if profile is not None:
+            try:
+                profile.enable()
+            except ValueError:
+                # An outside profiler is active; samples still cover this scope
+                profile = None
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            wall_ms = (time.perf_counter() - start_wall) * 1000
+            cpu_ms = (time.thread_time() - start_cpu) * 1000
+            memory = None
+            if tracing and tracemalloc.is_tracing():
+                current, peak = tracemalloc.get_traced_memory()
+                memory = ((current - start_mem) / 1024, max(peak - start_mem, 0) / 1024)
+            with self._lock:
+                self._active[thread_id].pop()
+                if not self._active[thread_id]:
+                    del self._active[thread_id]
+                    del self._entry_frames[thread_id]
+                if use_cprofile:
+                    self._profiling_threads.discard(thread_id)
+                self._record(name, profile, wall_ms, cpu_ms, memory)
+
+    def _record(self, name: str, profile: Optional[cProfile.Profile], wall_ms: float, cpu_ms: float, memory: Optional[tuple]):
+        entry = self.scopes.setdefault(name, {"calls": 0, "wall_ms": 0.0, "cpu_ms": 0.0, "alloc_net_kb": 0.0, "alloc_peak_kb": 0.0})
+        entry["calls"] += 1
+        entry["wall_ms"] = round(entry["wall_ms"] + wall_ms, 3)
+        entry["cpu_ms"] = round(entry["cpu_ms"] + cpu_ms, 3)
+        if memory is not None:
+            entry["alloc_net_kb"] = round(entry["alloc_net_kb"] + memory[0], 2)
+            entry["alloc_peak_kb"] = round(max(entry["alloc_peak_kb"], memory[1]), 2)
+        if profile is not None:
+            stats = pstats.Stats(profile, stream=io.StringIO())
+            if name in self._profiles:
+                self._profiles[name].add(stats)
+            else:
+                self._profiles[name] = stats
+
+    def _sample_loop(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.sample_interval):
+            frames = sys._current_frames()
+            with self._lock:
+                active = {tid: (list(scopes), self._entry_frames[tid]) for tid, scopes in self._active.items()}
+            for thread_id, (scopes, entry) in active.items():
+                frame = frames.get(thread_id)
+                if frame is None or thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None and frame is not entry:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                self.stacks[";".join(scopes + stack[::-1])] += 1
+                # Attributed to the innermost scope, by the function on top of the stack
+                leaf = stack[0] if stack else _frame_label(entry.f_code)
+                self.scope_samples.setdefault(scopes[-1], Counter())[leaf] += 1
+
+    def write(self) -> Dict[str, Any]:
+        """
+        Writes per-scope .prof files, stacks.collapsed and the summary files to
+        `output_dir`, and returns the summary.
+        """
+        ensure_dir(self.output_dir)
+        for name, stats in self._profiles.items():
+            stats.dump_stats(os.path.join(self.output_dir, f"{name}.prof"))
+        if self.stacks:
+            write_text(os.path.join(self.output_dir, "stacks.collapsed"),
+                       "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common()))
+
+        summary = {
+            "scopes": {
+                name: {
+                    **entry,
+                    "cpu_top": _top_functions(self._profiles[name], self.top_n) if name in self._profiles else [],
+                    "sample_top": _top_samples(self.scope_samples.get(name, Counter()), self.top_n),
+                }
+                for name, entry in self.scopes.items()
+            },
+            "hotspots": _top_functions(_merge(self._profiles.values()), self.top_n) if self._profiles else [],
+            "alloc_top": self.alloc_top,
+            "samples": sum(self.stacks.values()),
+        }
+        write_json(os.path.join(self.output_dir, "summary.json"), summary)
+        write_text(os.path.join(self.output_dir, "summary.txt"), render_summary(summary, self.top_n))
+        return summary
+
+def _top_samples(samples: Counter, top_n: int) -> List[Dict[str, Any]]:
+    return [{"function": function, "samples": count} for function, count in samples.most_common(top_n)]
+
+def _merge(all_stats) -> pstats.Stats:
+    merged = None
+    for stats in all_stats:
+        if merged is None:
+            merged = pstats.Stats(stream=io.StringIO())
+        merged.add(stats)
+    return merged
+
+def render_summary(summary: Dict[str, Any], top_n: int = 20) -> str:
+    lines = ["Scopes (wall / thread CPU / net allocated / peak allocated):"]
+    for name, entry in sorted(summary["scopes"].items(), key=lambda item: item[1]["wall_ms"], reverse=True):
+        lines.append(f"  {name:<50} {entry['wall_ms']:>10.1f} ms {entry['cpu_ms']:>10.1f} ms {entry['alloc_net_kb']:>10.1f} KB"
+                     f" {entry['alloc_peak_kb']:>10.1f} KB  (x{entry['calls']})")
+    lines.append("")
+    lines.append(f"Top {top_n} functions by own CPU time:")
+    for row in summary["hotspots"][:top_n]:
+        lines.append(f"  {row['tottime_ms']:>10.2f} ms own {row['cumtime_ms']:>10.2f} ms cum {row['ncalls']:>8}  {row['function']}")
+    lines.append("")
+    lines.append("Most sampled functions per scope:")
+    for name, entry in sorted(summary["scopes"].items()):
+        top = ", ".join(f"{row['function']} ({row['samples']})" for row in entry.get("sample_top", [])[:3])
+        if top:
+            lines.append(f"  {name:<50} {top}")
+    lines.append("")
+    lines.append(f"Top {top_n} allocation sites alive at the end of the run:")
+    for row in summary["alloc_top"][:top_n]:
+        lines.append(f"  {row['size_kb']:>10.1f} KB {row['count']:>8} blocks  {row['site']}")
+    return "\n".join(lines) + "\n"
+
+def aggregate_profiles(run_dirs: List[str], output_dir: str, top_n: int = 20) -> Optional[Dict[str, Any]]:
+    """
+    Sums the per-run profiles of `run_dirs` by scope into `output_dir`, e.g.
+    for every run of a batch. Returns None when no run was profiled.
+    """
+    profiles: Dict[str, pstats.Stats] = {}
+    scopes: Dict[str, Dict[str, Any]] = {}
+    stacks: Counter = Counter()
+    scope_samples: Dict[str, Counter] = {}
+    alloc_sites: Dict[str, Dict[str, float]] = {}
+    runs = 0
+
+    for run_dir in run_dirs:
+        profile_dir = os.path.join(run_dir, PROFILE_DIR)
+        summary_path = os.path.join(profile_dir, "summary.json")
+        if not os.path.exists(summary_path):
+            continue
+        runs += 1
+        run_summary = read_json(summary_path)
+        for name, entry in run_summary["scopes"].items():
+            total = scopes.setdefault(name, {"calls": 0, "wall_ms": 0.0, "cpu_ms": 0.0, "alloc_net_kb": 0.0, "alloc_peak_kb": 0.0})
+            for key in ("calls", "wall_ms", "cpu_ms", "alloc_net_kb"):
+                total[key] = round(total[key] + entry[key], 3)
+            total["alloc_peak_kb"] = max(total["alloc_peak_kb"], entry["alloc_peak_kb"])
+            samples = scope_samples.setdefault(name, Counter())
+            for row in entry.get("sample_top", []):
+                samples[row["function"]] += row["samples"]
+        for row in run_summary["alloc_top"]:
+            site = alloc_sites.setdefault(row["site"], {"site": row["site"], "size_kb": 0.0, "count": 0})
+            site["size_kb"] = round(site["size_kb"] + row["size_kb"], 2)
+            site["count"] += row["count"]
+        for file_name in os.listdir(profile_dir):
+            if file_name.endswith(".prof"):
+                name = file_name[:-len(".prof")]
+                stats = pstats.Stats(os.path.join(profile_dir, file_name), stream=io.StringIO())
+                if name in profiles:
+                    profiles[name].add(stats)
+                else:
+                    profiles[name] = stats
+        stacks_path = os.path.join(profile_dir, "stacks.collapsed")
+        if os.path.exists(stacks_path):
+            with open(stacks_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    stack, _, count = line.rstrip("\n").rpartition(" ")
+                    stacks[stack] += int(count)
+
+    if not runs:
+        return None
+
+    ensure_dir(output_dir)
+    for name, stats in profiles.items():
+        stats.dump_stats(os.path.join(output_dir, f"{name}.prof"))
+    if stacks:
+        write_text(os.path.join(output_dir, "stacks.collapsed"), "".join(f"{s} {c}\n" for s, c in stacks.most_common()))
+    summary = {
+        "runs": runs,
+        "scopes": {name: {**entry, "cpu_top": _top_functions(profiles[name], top_n) if name in profiles else [],
+                          "sample_top": _top_samples(scope_samples[name], top_n)}
+                   for name, entry in scopes.items()},
+        "hotspots": _top_functions(_merge(profiles.values()), top_n) if profiles else [],
+        "alloc_top": sorted(alloc_sites.values(), key=lambda row: row["size_kb"], reverse=True)[:top_n],
+        "samples": sum(stacks.values()),
+    }
+    write_json(os.path.join(output_dir, "summary.json"), summary)
+    write_text(os.path.join(output_dir, "summary.txt"), f"Aggregated over {runs} runs\n" + render_summary(summary, top_n))
+    return summary
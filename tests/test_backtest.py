@@ -0,0 +1,55 @@
+from datetime import date, timedelta
+from src.orchestrator.backtest import Backtester, NewsHistory, PriceHistory
+from src.tools.price_fetcher import fetch_prices
+from src.tools.signal_calculators import compute_volatility, compute_drawdown
+
+def _steady_prices(ticker, days):
+    start = date(2020, 1, 1)
+    return [
+        {"date": (start + timedelta(days=i)).isoformat(), "close": 100.0 * (1.0001 ** i), "volume": 1}
+        for i in range(days)
+    ]
+
+def test_price_history_matches_calculators():
+    bars = fetch_prices("TSLA", 120)
+    history = PriceHistory(bars)
+    for end in (29, 75, 119):
+        window = bars[end - 29:end + 1]
+        assert abs(history.volatility(end, 30) - compute_volatility(window)) < 1e-9
+        assert abs(history.drawdown(end, 30) - compute_drawdown(window)) < 1e-12
+
+def test_backtest_hit_rates():
+    backtester = Backtester(price_source=_steady_prices, news_source=lambda ticker, days, end: [])
+    summary = backtester.run(["AAA", "BBB"], days=100)
+
+    assert summary["snapshots"] == 2 * (100 - 29 - 21)
+    assert summary["by_verdict"]["HOLD"]["hit_rate"] == 1.0
+
+def test_news_history_clusters_each_window():
+    story = {"title": "TSLA faces lawsuit over autopilot", "snippet": "Drivers sue the company over a series of crashes"}
+    articles = [
+        {**story, "date": "2020-01-01", "sentiment": "negative"},
+        {**story, "date": "2020-01-02", "sentiment": "negative"},
+        {"title": "TSLA unveils new product line", "snippet": "Three new vehicles", "date": "2020-01-02", "sentiment": "positive"},
+        {**story, "date": "2020-01-09", "sentiment": "negative"},
+    ]
+    history = NewsHistory(articles)
+
+    stories, flags = history.window("2020-01-01", "2020-01-07")
+    assert [s["cluster_size"] for s in stories] == [2, 1]
+    assert len(flags) == 1
+
+    # The copy published after the snapshot does not count towards it
+    stories, _ = history.window("2020-01-02", "2020-01-07")
+    assert [s["cluster_size"] for s in stories] == [1, 1]
+
+def test_news_window_spans_the_bar_dates():
+    requests = []
+
+    def news_source(ticker, days, end):
+        requests.append((days, end))
+        return []
+
+    # 100 daily bars from 2020-01-01 end on 2020-04-09
+    Backtester(price_source=_steady_prices, news_source=news_source, news_window_days=7).backtest_ticker("AAA", 100)
+    assert requests == [(99 + 7, date(2020, 4, 9))]
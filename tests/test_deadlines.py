@@ -0,0 +1,37 @@
+import json
+import time
+from src.orchestrator.flow import OrchestratorFlow
+from src.tools.evidence_store import EvidenceStore
+
+class SlowCrew:
+    def execute(self, inputs: dict):
+        time.sleep(5)
+        return []
+
+class FailingCrew:
+    def execute(self, inputs: dict):
+        raise RuntimeError("vendor unavailable")
+
+def test_timeouts_and_failures_degrade_instead_of_aborting(tmp_path):
+    flow = OrchestratorFlow(store=EvidenceStore(str(tmp_path / "evidence.db")))
+    flow.runs_dir = str(tmp_path / "runs")
+    flow.crews["PriceCrew"] = SlowCrew()
+    flow.crews["NewsCrew"] = FailingCrew()
+    flow.crew_timeouts = {"PriceCrew": 0.2}
+
+    started = time.monotonic()
+    run_dir = flow.run("TSLA", "1m", "normal")
+    assert time.monotonic() - started < 3
+
+    with open(f"{run_dir}/events.jsonl") as f:
+        events = [json.loads(line) for line in f]
+    types = [e["type"] for e in events]
+    assert "TASK_TIMEOUT" in types
+    assert "TASK_FAILED" in types
+    degraded = next(e for e in events if e["type"] == "VERDICT_DEGRADED")
+    assert set(degraded["missing_categories"]) == {"price", "news"}
+
+    with open(f"{run_dir}/final_report.json") as f:
+        report = json.load(f)
+    assert report["confidence"] == degraded["confidence_after"]
+    assert report["confidence"] < degraded["confidence_before"]
@@ -0,0 +1,61 @@
+import time
+from src.orchestrator.early_decision import EarlyDecisionPolicy
+from src.orchestrator.evidence_buffer import to_records
+from src.orchestrator.flow import OrchestratorFlow
+from src.orchestrator.synthesis import Synthesizer
+from src.orchestrator.verdict import VerdictEngine
+from src.schemas.evidence import Evidence
+from src.schemas.plan import ResearchTaskSpec
+from src.schemas.report import Verdict
+from src.tools.evidence_store import EvidenceStore
+
+def _evidences():
+    return [
+        Evidence(id="v1", source_type="price", source_ref="x", claim="Volatility for TSLA is 55.00%", confidence=0.95, tags=["volatility", "risk"]),
+        Evidence(id="r1", source_type="news", source_ref="x", claim="Identified potential red flags: Found 'lawsuit' in article: TSLA", confidence=0.7, tags=["risk", "legal"]),
+    ]
+
+def test_early_decision_settles_when_outstanding_crews_cannot_flip():
+    policy = EarlyDecisionPolicy(Synthesizer(), VerdictEngine())
+
+    label, (low, high) = policy.check(_evidences(), ["OptionsLiquidityCrew", "DebateCrew"])
+    assert label == Verdict.STRONG_SELL
+    assert low == high
+
+    label, _ = policy.check(_evidences(), ["NewsCrew", "FundamentalsCrew"])
+    assert label is None
+
+def test_unknown_crews_keep_every_component_open():
+    policy = EarlyDecisionPolicy(Synthesizer(), VerdictEngine())
+    label, _ = policy.check(_evidences(), ["SomeNewCrew"])
+    assert label is None
+
+def test_latency_saved_is_estimated_on_a_fresh_run(tmp_path):
+    store = EvidenceStore(str(tmp_path / "evidence.db"))
+    remaining = [ResearchTaskSpec(id="t1", name="debate", description="", crew="DebateCrew", inputs={"ticker": "TSLA"})]
+
+    # No history yet: the configured per-crew default is used
+    flow = OrchestratorFlow(store=store, early_decision=True)
+    flow.default_crew_latencies_ms = {"DebateCrew": 4000}
+    assert flow._try_early_stop(remaining, to_records(_evidences()), ["OptionsLiquidityCrew"], str(tmp_path / "r1"))
+    assert flow.early_stop["estimated_latency_saved_ms"] == 4000
+
+    # Latencies recorded by earlier runs take precedence
+    store.record_latency("DebateCrew", 1500)
+    flow = OrchestratorFlow(store=store, early_decision=True)
+    assert flow._try_early_stop(remaining, to_records(_evidences()), ["OptionsLiquidityCrew"], str(tmp_path / "r2"))
+    assert flow.early_stop["estimated_latency_saved_ms"] == 1500
+
+def test_latency_saved_excludes_time_already_spent_by_running_tasks(tmp_path):
+    remaining = [
+        ResearchTaskSpec(id="t1", name="debate", description="", crew="DebateCrew", inputs={"ticker": "TSLA"}),
+        ResearchTaskSpec(id="t2", name="options", description="", crew="OptionsLiquidityCrew", inputs={"ticker": "TSLA"}),
+    ]
+    flow = OrchestratorFlow(store=EvidenceStore(str(tmp_path / "evidence.db")), early_decision=True)
+    flow.default_crew_latencies_ms = {"DebateCrew": 4000, "OptionsLiquidityCrew": 1000}
+
+    # The debate has been running for ~3s and the options task for longer than it is expected to take
+    now = time.monotonic()
+    started = {"t1": now - 3.0, "t2": now - 5.0}
+    assert flow._try_early_stop(remaining, to_records(_evidences()), [], str(tmp_path / "r1"), started)
+    assert 0 < flow.early_stop["estimated_latency_saved_ms"] <= 1000
@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta
+from src.schemas.evidence import Evidence
+from src.tools.evidence_store import EvidenceStore, inputs_digest
+
+def _ev(id, source_type, tags, confidence=0.8, age_days=0):
+    return Evidence(
+        id=id, source_type=source_type, source_ref="test", claim=f"claim {id}",
+        confidence=confidence, timestamp=datetime.utcnow() - timedelta(days=age_days), tags=tags
+    )
+
+def test_store_filtered_queries(tmp_path):
+    store = EvidenceStore(str(tmp_path / "evidence.db"))
+    store.add([
+        _ev("a", "news", ["risk", "legal"]),
+        _ev("b", "news", ["legal"], age_days=45),
+        _ev("c", "price", ["volatility", "risk"], confidence=0.95),
+    ], "TSLA", run_id="r1", crew="NewsCrew", task="news_analysis")
+    store.add([_ev("d", "news", ["legal"])], "AAPL", run_id="r2")
+
+    recent_legal = store.query(ticker="TSLA", tags=["legal"], since=datetime.utcnow() - timedelta(days=30))
+    assert [ev.id for ev in recent_legal] == ["a"]
+    assert [ev.id for ev in store.query(ticker="TSLA", source_type="price")] == ["c"]
+    assert {ev.id for ev in store.query(ticker="TSLA", min_confidence=0.9)} == {"c"}
+    assert {ev.id for ev in store.query(tags=["legal"])} == {"a", "b", "d"}
+
+def test_store_reuse_window(tmp_path):
+    store = EvidenceStore(str(tmp_path / "evidence.db"))
+    digest = inputs_digest({"ticker": "TSLA"})
+    store.add([_ev("a", "price", ["volatility"])], "TSLA", run_id="r1", crew="PriceCrew", task="price_analysis", inputs_hash=digest)
+
+    reused = store.find_reusable("TSLA", "PriceCrew", "price_analysis", timedelta(hours=1), digest)
+    assert [ev.id for ev in reused] == ["a"]
+    assert store.find_reusable("TSLA", "NewsCrew", "news_analysis", timedelta(hours=1), digest) == []
+
+def test_store_reuse_requires_same_inputs(tmp_path):
+    store = EvidenceStore(str(tmp_path / "evidence.db"))
+    lawsuit = inputs_digest({"ticker": "TSLA", "issues": ["lawsuit"]})
+    store.add([_ev("a", "news", ["legal"])], "TSLA", run_id="r1", crew="RegulationLegalCrew", task="legal_analysis", inputs_hash=lawsuit)
+
+    recall = inputs_digest({"issues": ["recall"], "ticker": "TSLA"})
+    assert store.find_reusable("TSLA", "RegulationLegalCrew", "legal_analysis", timedelta(hours=1), recall) == []
+    same = inputs_digest({"issues": ["lawsuit"], "ticker": "TSLA"})
+    assert [ev.id for ev in store.find_reusable("TSLA", "RegulationLegalCrew", "legal_analysis", timedelta(hours=1), same)] == ["a"]
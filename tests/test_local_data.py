@@ -0,0 +1,77 @@
+import json
+from datetime import date
+from src.tools.data_provider import set_data_provider
+from src.tools.local_data import LocalDataProvider, ingest_news_jsonl, ingest_prices_csv
+from src.tools.price_fetcher import fetch_prices
+
+def _write_inputs(tmp_path):
+    prices_csv = tmp_path / "prices.csv"
+    rows = ["ticker,date,open,high,low,close,volume"]
+    for day in range(1, 11):
+        rows.append(f"TSLA,2024-01-{day:02d},{day},{day + 1},{day - 1},{day + 0.5},1000")
+    prices_csv.write_text("\n".join(rows) + "\n")
+
+    news_jsonl = tmp_path / "news.jsonl"
+    articles = [
+        {"ticker": "TSLA", "date": "2024-01-09", "title": "TSLA faces SEC investigation"},
+        {"ticker": "TSLA", "date": "2024-01-02", "title": "TSLA ships new model"},
+        {"ticker": "AAPL", "date": "2024-01-05", "title": "AAPL earnings"},
+    ]
+    news_jsonl.write_text("\n".join(json.dumps(a) for a in articles) + "\n")
+    return prices_csv, news_jsonl
+
+def test_local_provider_range_lookups(tmp_path):
+    prices_csv, news_jsonl = _write_inputs(tmp_path)
+    root = str(tmp_path / "data")
+    assert ingest_prices_csv(str(prices_csv), root) == {"TSLA": 10}
+    assert ingest_news_jsonl(str(news_jsonl), root) == {"TSLA": 2, "AAPL": 1}
+
+    provider = LocalDataProvider(root)
+    bars = provider.get_bars("TSLA", start=date(2024, 1, 3), end=date(2024, 1, 5))
+    assert list(bars.close) == [3.5, 4.5, 5.5]
+
+    prices = provider.get_prices("TSLA", days=3, end=date(2024, 1, 8))
+    assert [p["date"] for p in prices] == ["2024-01-06", "2024-01-07", "2024-01-08"]
+
+    assert [a["title"] for a in provider.get_news("TSLA", days=7, end=date(2024, 1, 9))] == ["TSLA faces SEC investigation"]
+    assert len(provider.get_news("TSLA", days=30, end=date(2024, 1, 31))) == 2
+    assert provider.get_prices("MSFT") == []
+    provider.close()
+
+def test_fetch_prices_uses_installed_provider(tmp_path):
+    prices_csv, _ = _write_inputs(tmp_path)
+    root = str(tmp_path / "data")
+    ingest_prices_csv(str(prices_csv), root)
+
+    set_data_provider(LocalDataProvider(root))
+    try:
+        assert len(fetch_prices("TSLA", days=5)) == 5
+    finally:
+        set_data_provider(None)
+
+def test_news_without_corpus_file_is_empty(tmp_path):
+    _, news_jsonl = _write_inputs(tmp_path)
+    root = tmp_path / "data"
+    ingest_news_jsonl(str(news_jsonl), str(root))
+    (root / "news" / "TSLA.jsonl").unlink()
+
+    provider = LocalDataProvider(str(root))
+    assert provider.get_news("TSLA", days=30, end=date(2024, 1, 31)) == []
+    assert len(provider.get_news("AAPL", days=30, end=date(2024, 1, 31))) == 1
+    provider.close()
+
+def test_reingesting_news_does_not_duplicate_articles(tmp_path):
+    _, news_jsonl = _write_inputs(tmp_path)
+    root = str(tmp_path / "data")
+    assert ingest_news_jsonl(str(news_jsonl), root) == {"TSLA": 2, "AAPL": 1}
+    assert ingest_news_jsonl(str(news_jsonl), root) == {"TSLA": 2, "AAPL": 1}
+
+    # A corrected copy of an article replaces the stored one
+    update = tmp_path / "update.jsonl"
+    update.write_text(json.dumps({"ticker": "TSLA", "date": "2024-01-02", "title": "TSLA ships new model", "snippet": "fixed"}) + "\n")
+    assert ingest_news_jsonl(str(update), root) == {"TSLA": 2}
+
+    provider = LocalDataProvider(root)
+    articles = provider.get_news("TSLA", days=30, end=date(2024, 1, 31))
+    assert [a.get("snippet") for a in articles] == ["fixed", None]
+    provider.close()
@@ -0,0 +1,34 @@
+from src.crews.news_crew import NewsCrew
+from src.orchestrator.synthesis import Synthesizer
+from src.tools.news_dedup import NewsDeduplicator, SignatureCache, weighted_sentiment
+
+def _articles():
+    story = "Regulators open investigation into TSLA autopilot crashes after a series of incidents reported by drivers"
+    return [
+        {"title": "TSLA faces federal probe", "snippet": story, "sentiment": "negative"},
+        {"title": "TSLA faces federal probe", "snippet": story + " (Reuters)", "sentiment": "negative"},
+        {"title": "TSLA faces federal probe", "snippet": story, "sentiment": "negative"},
+        {"title": "TSLA unveils new product line", "snippet": "The company showed three new vehicles at its annual event", "sentiment": "positive"},
+    ]
+
+def test_clusters_syndicated_copies(tmp_path):
+    dedup = NewsDeduplicator(SignatureCache(str(tmp_path / "signatures.db")))
+    stories = dedup.cluster(_articles())
+
+    assert [s["cluster_size"] for s in stories] == [3, 1]
+    assert weighted_sentiment(stories) == -0.5
+
+def test_signatures_are_cached_across_runs(tmp_path):
+    path = str(tmp_path / "signatures.db")
+    first = NewsDeduplicator(SignatureCache(path)).signatures(_articles())
+
+    cache = SignatureCache(path)
+    assert len(cache) == 3
+    assert NewsDeduplicator(cache).signatures(_articles()) == first
+
+def test_synthesizer_reads_weighted_sentiment_score(tmp_path):
+    dedup = NewsDeduplicator(SignatureCache(str(tmp_path / "signatures.db")))
+    stories = dedup.cluster(_articles())
+    evidences = NewsCrew.build_evidence("TSLA", stories, [])
+
+    assert Synthesizer().build_signals(evidences).sentiment_score == -0.5
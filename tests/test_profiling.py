@@ -0,0 +1,71 @@
+import os
+import time
+import pytest
+from src.orchestrator.flow import OrchestratorFlow
+from src.tools.evidence_store import EvidenceStore
+from src.utils import profiling
+from src.utils.io import read_json
+from src.utils.profiling import RUN_PROFILE, RunProfiler, aggregate_profiles
+
+# Both modes are exercised whatever the interpreter; 3.12+ defaults to process-wide
+@pytest.fixture(params=[False, True], ids=["per_scope", "process_wide"])
+def process_wide(request, monkeypatch):
+    monkeypatch.setattr(profiling, "PROCESS_WIDE_CPROFILE", request.param)
+    return request.param
+
+def _profiled_run(tmp_path, ticker):
+    flow = OrchestratorFlow(store=EvidenceStore(str(tmp_path / "evidence.db")), profile=True)
+    flow.runs_dir = str(tmp_path / "runs")
+    flow.profile_sample_interval = 0.001
+    return flow.run(ticker, "1m", "normal")
+
+def test_profile_is_scoped_by_stage_and_crew(tmp_path, process_wide):
+    run_dir = _profiled_run(tmp_path, "TSLA")
+    profile_dir = os.path.join(run_dir, "profile")
+    summary = read_json(os.path.join(profile_dir, "summary.json"))
+
+    assert {"stage.plan", "stage.base_tasks", "stage.verdict", "crew.PriceCrew.price_analysis"} <= set(summary["scopes"])
+    assert summary["hotspots"]
+    if process_wide:
+        assert os.path.exists(os.path.join(profile_dir, f"{RUN_PROFILE}.prof"))
+        assert not os.path.exists(os.path.join(profile_dir, "crew.PriceCrew.price_analysis.prof"))
+        assert all(entry["cpu_top"] == [] for entry in summary["scopes"].values())
+        assert any(entry["sample_top"] for entry in summary["scopes"].values())
+    else:
+        assert summary["scopes"]["crew.NewsCrew.news_analysis"]["cpu_top"]
+        assert os.path.exists(os.path.join(profile_dir, "crew.PriceCrew.price_analysis.prof"))
+        # Stages that only wait on crews are not cProfiled
+        assert not os.path.exists(os.path.join(profile_dir, "stage.base_tasks.prof"))
+    with open(os.path.join(profile_dir, "summary.txt")) as f:
+        assert "Top 20 functions" in f.read()
+
+    # Collapsed stacks start at the scope, not at the interpreter entry point
+    with open(os.path.join(profile_dir, "stacks.collapsed")) as f:
+        stacks = [line.rsplit(" ", 1)[0] for line in f]
+    assert stacks and all(s.split(";")[0].startswith(("stage.", "crew.")) for s in stacks)
+    assert not any("pytest" in s for s in stacks)
+
+def test_profiles_aggregate_across_runs(tmp_path, process_wide):
+    run_dirs = [_profiled_run(tmp_path, t) for t in ("AAA", "BBB")]
+    summary = aggregate_profiles(run_dirs + [str(tmp_path / "missing")], str(tmp_path / "batch_profile"))
+    assert summary["runs"] == 2
+    assert summary["scopes"]["stage.plan"]["calls"] == 2
+    expected = RUN_PROFILE if process_wide else "stage.plan"
+    assert os.path.exists(tmp_path / "batch_profile" / f"{expected}.prof")
+    assert summary["hotspots"]
+
+def test_process_wide_profiler_attributes_samples_to_scopes(tmp_path):
+    profiler = RunProfiler(str(tmp_path / "profile"), sample_interval=0.001, process_wide=True)
+    profiler.start()
+    with profiler.scope("stage.base_tasks", cpu_profile=False):
+        with profiler.scope("crew.Busy.spin"):
+            deadline = time.perf_counter() + 0.05
+            while time.perf_counter() < deadline:
+                sum(range(100))
+    profiler.stop()
+    summary = profiler.write()
+
+    assert os.path.exists(tmp_path / "profile" / "run.prof")
+    assert summary["hotspots"]
+    assert summary["scopes"]["crew.Busy.spin"]["cpu_top"] == []
+    assert any("test_profiling.py" in row["function"] for row in summary["scopes"]["crew.Busy.spin"]["sample_top"])
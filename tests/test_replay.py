@@ -0,0 +1,24 @@
+import csv
+from src.orchestrator.replay import replay_runs
+from src.schemas.evidence import Evidence
+from src.utils.io import write_json, write_jsonl
+
+def test_replay_flags_changed_verdicts(tmp_path):
+    run_dir = tmp_path / "runs" / "20240101_000000_TSLA"
+    evidences = [
+        Evidence(id="a1", source_type="news", source_ref="x", claim="Analyst upgrades TSLA to Buy", confidence=0.9, tags=["sentiment"]),
+        Evidence(id="b2", source_type="analysis", source_ref="10-K", claim="TSLA looks undervalued", confidence=0.9, tags=["valuation"]),
+    ]
+    write_json(str(run_dir / "evidence.json"), [e.model_dump() for e in evidences])
+    write_jsonl(str(run_dir / "events.jsonl"), {"type": "RUN_STARTED", "ticker": "TSLA"})
+    write_jsonl(str(run_dir / "events.jsonl"), {"type": "run_COMPLETE", "verdict": "SELL"})
+
+    output = tmp_path / "replay.csv"
+    summary = replay_runs(str(tmp_path / "runs"), str(output), workers=1)
+
+    assert summary["runs"] == 1
+    assert summary["transitions"] == {"SELL->STRONG_BUY": 1}
+    with open(output) as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["ticker"] == "TSLA"
+    assert rows[0]["new_verdict"] == "STRONG_BUY"
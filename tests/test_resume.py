@@ -0,0 +1,151 @@
+import os
+from src.app import run_batch
+from src.orchestrator.flow import OrchestratorFlow
+from src.tools.evidence_store import EvidenceStore
+from src.utils.io import read_json, read_jsonl
+
+class CrashingCrew:
+    def __init__(self, crew):
+        self.crew = crew
+        self.crash = True
+        self.calls = 0
+
+    def execute(self, inputs: dict):
+        self.calls += 1
+        if self.crash:
+            raise KeyboardInterrupt("worker killed")
+        return self.crew.execute(inputs)
+
+class CountingCrew:
+    def __init__(self, crew):
+        self.crew = crew
+        self.calls = 0
+
+    def execute(self, inputs: dict):
+        self.calls += 1
+        return self.crew.execute(inputs)
+
+def _flow(tmp_path):
+    flow = OrchestratorFlow(store=EvidenceStore(str(tmp_path / "evidence.db")))
+    flow.runs_dir = str(tmp_path / "runs")
+    flow.max_parallel_tasks = 1
+    return flow
+
+def test_resume_skips_checkpointed_tasks(tmp_path):
+    flow = _flow(tmp_path)
+    price = flow.crews["PriceCrew"] = CountingCrew(flow.crews["PriceCrew"])
+    fundamentals = flow.crews["FundamentalsCrew"] = CrashingCrew(flow.crews["FundamentalsCrew"])
+
+    # The interrupt escapes the task thread like a killed process would end the run
+    try:
+        flow.run("TSLA", "1m", "normal", run_id="r1")
+    except KeyboardInterrupt:
+        pass
+    run_dir = f"{flow.runs_dir}/r1"
+    assert not any(e["type"] == "run_COMPLETE" for e in read_jsonl(f"{run_dir}/events.jsonl"))
+
+    fundamentals.crash = False
+    assert flow.resume("r1") == run_dir
+    assert price.calls == 1
+    assert fundamentals.calls == 2
+
+    events = read_jsonl(f"{run_dir}/events.jsonl")
+    resumed = next(e for e in events if e["type"] == "RUN_RESUMED")
+    assert resumed["stage"] == "base" and resumed["restored_tasks"] == 2
+    assert {e["task"] for e in events if e["type"] == "TASK_RESTORED"} == {"price_analysis", "news_analysis"}
+    report = read_json(f"{run_dir}/final_report.json")
+    assert any(ev["source_type"] == "analysis" for ev in report["evidence"])
+
+    # A completed run is left as is
+    flow.resume("r1")
+    assert price.calls == 1
+
+def test_batch_resume_retries_only_failed_tickers(tmp_path, monkeypatch):
+    calls = []
+    real_run = OrchestratorFlow.run
+
+    def flaky_run(self, ticker, horizon, risk_profile, run_id=None):
+        calls.append(ticker)
+        if ticker == "BAD" and calls.count("BAD") == 1:
+            raise RuntimeError("vendor unavailable")
+        return real_run(self, ticker, horizon, risk_profile, run_id=run_id)
+
+    monkeypatch.setattr(OrchestratorFlow, "run", flaky_run)
+    monkeypatch.setattr("src.app.load_config", lambda name: {"runs_dir": str(tmp_path / "runs"), "reports_dir": str(tmp_path / "reports")})
+    monkeypatch.setattr(OrchestratorFlow, "__init__", _patched_init(tmp_path))
+
+    batch_dir = run_batch(["GOOD", "BAD"])
+    # runs/ only holds run directories; the manifest is a report
+    assert os.path.dirname(batch_dir) == str(tmp_path / "reports")
+    assert all(name.endswith(("_GOOD", "_BAD")) for name in os.listdir(tmp_path / "runs"))
+    manifest = read_json(f"{batch_dir}/batch.json")
+    assert manifest["tickers"]["GOOD"]["status"] == "done"
+    assert manifest["tickers"]["BAD"]["status"] == "failed"
+
+    run_batch([], resume=batch_dir)
+    manifest = read_json(f"{batch_dir}/batch.json")
+    assert all(entry["status"] == "done" for entry in manifest["tickers"].values())
+    assert calls == ["GOOD", "BAD", "BAD"]
+
+def _patched_init(tmp_path):
+    real_init = OrchestratorFlow.__init__
+
+    def init(self, *args, **kwargs):
+        kwargs.setdefault("store", EvidenceStore(str(tmp_path / "evidence.db")))
+        real_init(self, *args, **kwargs)
+        self.runs_dir = str(tmp_path / "runs")
+    return init
+
+class FailingCrew(CountingCrew):
+    def __init__(self, crew):
+        super().__init__(crew)
+        self.fail = True
+
+    def execute(self, inputs: dict):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("vendor unavailable")
+        return self.crew.execute(inputs)
+
+def test_resume_retries_failed_tasks_of_completed_run(tmp_path):
+    flow = _flow(tmp_path)
+    price = flow.crews["PriceCrew"] = CountingCrew(flow.crews["PriceCrew"])
+    fundamentals = flow.crews["FundamentalsCrew"] = FailingCrew(flow.crews["FundamentalsCrew"])
+
+    # An ordinary crew error is caught, so the run completes without the task
+    run_dir = flow.run("TSLA", "1m", "normal", run_id="r1")
+    assert flow.failed_tasks == ["fundamental_analysis"]
+    assert any(e["type"] == "run_COMPLETE" for e in read_jsonl(f"{run_dir}/events.jsonl"))
+
+    fundamentals.fail = False
+    flow.resume("r1")
+    assert flow.failed_tasks == []
+    assert price.calls == 1
+    assert fundamentals.calls == 2
+    report = read_json(f"{run_dir}/final_report.json")
+    assert any(ev["source_ref"] == "10-K" for ev in report["evidence"])
+
+    flow.resume("r1")
+    assert fundamentals.calls == 2
+
+def test_batch_marks_runs_with_failed_tasks_partial(tmp_path, monkeypatch):
+    crews = []
+    real_init = _patched_init(tmp_path)
+
+    def init(self, *args, **kwargs):
+        real_init(self, *args, **kwargs)
+        if not crews:
+            crews.append(FailingCrew(self.crews["FundamentalsCrew"]))
+        self.crews["FundamentalsCrew"] = crews[0]
+
+    monkeypatch.setattr("src.app.load_config", lambda name: {"runs_dir": str(tmp_path / "runs"), "reports_dir": str(tmp_path / "reports")})
+    monkeypatch.setattr(OrchestratorFlow, "__init__", init)
+
+    batch_dir = run_batch(["TSLA"])
+    entry = read_json(f"{batch_dir}/batch.json")["tickers"]["TSLA"]
+    assert entry["status"] == "partial" and "fundamental_analysis" in entry["error"]
+
+    crews[0].fail = False
+    run_batch([], resume=batch_dir)
+    assert read_json(f"{batch_dir}/batch.json")["tickers"]["TSLA"]["status"] == "done"
+    assert crews[0].calls == 2
@@ -0,0 +1,64 @@
+import json
+from datetime import datetime
+from uuid import uuid4
+from src.orchestrator.evidence_buffer import EvidenceRecord
+from src.orchestrator.flow import OrchestratorFlow
+from src.orchestrator.retrieval import EvidenceRetriever
+from src.schemas.plan import ResearchTaskSpec
+from src.tools.embeddings import CachedEmbedder, EmbeddingCache, HashingEmbedder
+from src.tools.evidence_store import EvidenceStore
+
+def _record(claim, source_type="news", confidence=0.8):
+    return EvidenceRecord(str(uuid4()), source_type, "test", claim, confidence, datetime(2024, 1, 1))
+
+def test_embedding_cache_persists_across_instances(tmp_path):
+    path = str(tmp_path / "embeddings.db")
+    first = CachedEmbedder(HashingEmbedder(64), EmbeddingCache(path))
+    vectors = first.embed(["TSLA faces lawsuit", "TSLA record results", "TSLA faces lawsuit"])
+    assert first.misses == 2
+
+    second = CachedEmbedder(HashingEmbedder(64), EmbeddingCache(path))
+    again = second.embed(["TSLA record results", "TSLA faces lawsuit"])
+    assert second.misses == 0
+    assert all(abs(a - b) < 1e-6 for a, b in zip(again[1], vectors[0]))
+
+def test_debate_context_is_bounded_and_split_by_side(tmp_path):
+    evidences = [_record(f"TSLA analyst upgrade to buy on record breaking results #{i}") for i in range(200)]
+    evidences += [_record(f"TSLA faces lawsuit and regulator investigation #{i}") for i in range(200)]
+    evidences.append(_record("Earlier debate conclusion", source_type="synthesis"))
+
+    retriever = EvidenceRetriever(embedder=HashingEmbedder(128), top_k=3, max_chars=400)
+    context = retriever.debate_context(evidences)
+    assert 0 < len(context["bull"]) <= 3 and 0 < len(context["bear"]) <= 3
+    assert all("upgrade" in item["claim"] for item in context["bull"])
+    assert all("lawsuit" in item["claim"] for item in context["bear"])
+    assert sum(len(item["claim"]) for side in context.values() for item in side) <= 400
+
+def test_flow_feeds_retrieved_context_to_debate_crew(tmp_path):
+    flow = OrchestratorFlow(store=EvidenceStore(str(tmp_path / "evidence.db")))
+    flow._retriever = EvidenceRetriever(embedder=HashingEmbedder(64), top_k=2)
+    run_dir = str(tmp_path / "run")
+    prior = [_record(f"TSLA CEO faces lawsuit #{i}") for i in range(50)]
+    task = ResearchTaskSpec(id="t1", name="debate", description="", crew="DebateCrew", inputs={"ticker": "TSLA"})
+
+    results = flow._execute_tasks([task], run_dir, prior=prior)
+    assert results[0].raw_snippet.count("lawsuit") <= 4
+
+    with open(f"{run_dir}/events.jsonl") as f:
+        retrieved = next(e for e in map(json.loads, f) if e["type"] == "CONTEXT_RETRIEVED")
+    assert retrieved["candidates"] == 50
+    assert len(retrieved["bull"]) + len(retrieved["bear"]) <= 4
+
+def test_conflicting_evidence_trigger_reaches_retrieval_through_run(tmp_path):
+    flow = OrchestratorFlow(store=EvidenceStore(str(tmp_path / "evidence.db")))
+    flow._retriever = EvidenceRetriever(embedder=HashingEmbedder(64), top_k=2)
+    flow.runs_dir = str(tmp_path / "runs")
+    run_dir = flow.run("TSLA", "1m", "normal")
+
+    with open(f"{run_dir}/triggers.json") as f:
+        assert "DebateCrew" in [t["crew"] for t in json.load(f)]
+    with open(f"{run_dir}/events.jsonl") as f:
+        assert any(e["type"] == "CONTEXT_RETRIEVED" for e in map(json.loads, f))
+    with open(f"{run_dir}/evidence.json") as f:
+        debate = next(ev for ev in json.load(f) if "debate" in ev["tags"])
+    assert debate["raw_snippet"].startswith("Debate the bull and bear cases for TSLA")
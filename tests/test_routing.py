@@ -0,0 +1,30 @@
+from src.orchestrator.routing import ModelRouter
+from src.schemas.evidence import Evidence
+from src.schemas.plan import ResearchTaskSpec
+
+def _task(crew, origin="base", **inputs):
+    return ResearchTaskSpec(
+        id="t1", name="task", description="test", crew=crew,
+        inputs={"ticker": "TSLA", **inputs}, origin=origin
+    )
+
+def test_router_tiers():
+    router = ModelRouter(
+        model_config={"fast_model": "fast", "smart_model": "smart"},
+        thresholds={"min_confidence_score": 0.6}
+    )
+    assert router.select(_task("NewsCrew", days=30)) == "fast"
+    assert router.select(_task("DebateCrew")) == "smart"
+    assert router.select(_task("RegulationLegalCrew", origin="trigger")) == "smart"
+    assert router.select(_task("NewsCrew", days=90)) == "smart"
+
+def test_router_escalates_low_confidence():
+    router = ModelRouter(
+        model_config={"fast_model": "fast", "smart_model": "smart"},
+        thresholds={"min_confidence_score": 0.6}
+    )
+    weak = [Evidence(id="1", source_type="news", source_ref="x", claim="c", confidence=0.3)]
+    strong = [Evidence(id="2", source_type="news", source_ref="x", claim="c", confidence=0.9)]
+    assert router.should_escalate("fast", weak)
+    assert not router.should_escalate("fast", strong)
+    assert not router.should_escalate("smart", weak)
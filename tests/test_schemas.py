@@ -18,3 +18,19 @@ def test_evidence_serialization():
     )
     data = ev.model_dump()
     assert data["confidence"] == 0.9
+
+def test_evidence_record_json_round_trip():
+    from src.orchestrator.evidence_buffer import dump_evidence_json, load_evidence_json, to_records
+
+    ev = Evidence(
+        id="123", source_type="news", source_ref="http", claim="test", confidence=0.9, tags=["risk"]
+    )
+    data = dump_evidence_json(to_records([ev]))
+    records = load_evidence_json(data)
+    assert records[0].to_model() == ev
+
+    try:
+        load_evidence_json(data.replace(b"0.9", b"1.9"))
+        assert False, "Should fail validation"
+    except ValueError:
+        pass
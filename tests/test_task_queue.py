@@ -0,0 +1,91 @@
+import json
+import threading
+import time
+from src.orchestrator.flow import OrchestratorFlow
+from src.orchestrator.worker import Worker
+from src.tools.evidence_store import EvidenceStore
+from src.tools.task_queue import CANCELLED, FAILED, PENDING, SQLiteTaskQueue
+
+def test_expired_lease_is_retried_then_failed(tmp_path):
+    queue = SQLiteTaskQueue(str(tmp_path / "queue.db"), max_attempts=2)
+    job_id = queue.enqueue("task", {"n": 1})
+
+    first = queue.lease("worker-a", ["task"], lease_seconds=0.05)
+    assert first.id == job_id and first.attempts == 1
+    assert queue.lease("worker-b", ["task"], lease_seconds=0.05) is None
+
+    # worker-a dies; after the lease expires another worker picks the job up
+    time.sleep(0.1)
+    second = queue.lease("worker-b", ["task"], lease_seconds=0.05)
+    assert second.id == job_id and second.attempts == 2
+    assert not queue.complete(job_id, "worker-a", {"late": True})
+
+    time.sleep(0.1)
+    assert queue.lease("worker-c", ["task"], lease_seconds=0.05) is None
+    assert queue.get(job_id).status == FAILED
+
+def test_failed_job_is_requeued_until_attempts_run_out(tmp_path):
+    queue = SQLiteTaskQueue(str(tmp_path / "queue.db"), max_attempts=2)
+    job_id = queue.enqueue("task", {})
+    queue.lease("w", ["task"], 30)
+    queue.fail(job_id, "w", "boom")
+    assert queue.get(job_id).status == PENDING
+    queue.lease("w", ["task"], 30)
+    queue.fail(job_id, "w", "boom again")
+    job = queue.get(job_id)
+    assert job.status == FAILED and job.error == "boom again"
+
+def test_distributed_run_uses_worker(tmp_path):
+    queue = SQLiteTaskQueue(str(tmp_path / "queue.db"))
+    worker_flow = OrchestratorFlow(store=EvidenceStore(str(tmp_path / "worker.db")))
+    worker = Worker(queue, flow=worker_flow, worker_id="node-1", heartbeat_seconds=0.05, kinds=["task"])
+    thread = threading.Thread(target=worker.run, kwargs={"idle_exit_seconds": 1.0, "poll_seconds": 0.02}, daemon=True)
+    thread.start()
+
+    flow = OrchestratorFlow(store=EvidenceStore(str(tmp_path / "evidence.db")), queue=queue)
+    flow.runs_dir = str(tmp_path / "runs")
+    run_dir = flow.run("TSLA", "1m", "normal")
+    thread.join(timeout=5)
+
+    with open(f"{run_dir}/events.jsonl") as f:
+        events = [json.loads(line) for line in f]
+    finished = [e for e in events if e["type"] == "TASK_FINISHED"]
+    assert finished and all(e["evidence_count"] > 0 for e in finished)
+    assert "TASK_FAILED" not in [e["type"] for e in events]
+    with open(f"{run_dir}/final_report.json") as f:
+        assert json.load(f)["evidence"]
+
+def test_cancelled_job_is_never_leased(tmp_path):
+    queue = SQLiteTaskQueue(str(tmp_path / "queue.db"))
+    pending = queue.enqueue("task", {})
+    leased = queue.enqueue("task", {})
+    assert queue.lease("w", ["task"], lease_seconds=0.05).id == pending
+    assert queue.cancel(pending)
+    assert queue.lease("w", ["task"], lease_seconds=0.05).id == leased
+    assert queue.cancel(leased)
+
+    # Neither the expired lease nor the cancelled pending job comes back
+    time.sleep(0.1)
+    assert queue.lease("w", ["task"], lease_seconds=0.05) is None
+    assert not queue.complete(leased, "w", {"late": True})
+    assert queue.wait([pending, leased], timeout=0)[leased].status == CANCELLED
+
+def test_timed_out_remote_task_is_cancelled(tmp_path):
+    queue = SQLiteTaskQueue(str(tmp_path / "queue.db"))
+    flow = OrchestratorFlow(store=EvidenceStore(str(tmp_path / "evidence.db")), queue=queue)
+    flow.runs_dir = str(tmp_path / "runs")
+    flow.crew_timeout = 0.1
+    flow.crew_timeouts = {}
+
+    # No worker is running, so every queued task times out
+    run_dir = flow.run("TSLA", "1m", "normal")
+    assert flow.timed_out_tasks
+    assert queue.lease("w", ["task"], lease_seconds=1) is None
+    with open(f"{run_dir}/events.jsonl") as f:
+        assert "TASK_TIMEOUT" in [json.loads(line)["type"] for line in f]
+
+def test_shared_filesystem_queue_uses_rollback_journal(tmp_path):
+    queue = SQLiteTaskQueue(str(tmp_path / "queue.db"), shared_filesystem=True)
+    assert queue._conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    job_id = queue.enqueue("task", {})
+    assert queue.lease("w", ["task"], 30).id == job_id
@@ -0,0 +1,66 @@
+import json
+import random
+from src.orchestrator.flow import OrchestratorFlow
+from src.orchestrator.watch import RollingStats, WatchEngine
+from src.tools.evidence_store import EvidenceStore
+from src.tools.signal_calculators import compute_volatility
+from src.tools.streams import FileTailSource, MockStreamSource, StreamEvent
+
+def test_rolling_stats_match_batch_calculators():
+    rng = random.Random(7)
+    closes = [100.0]
+    for _ in range(300):
+        closes.append(closes[-1] * (1 + rng.gauss(0, 0.03)))
+
+    stats = RollingStats(window=20)
+    for i, close in enumerate(closes):
+        stats.update(close)
+        if i >= 20:
+            window = closes[i - 20:i + 1]
+            assert abs(stats.volatility - compute_volatility([{"close": c} for c in window])) < 1e-9
+            assert abs(stats.drawdown - (close - max(window)) / max(window)) < 1e-12
+
+def _engine(tmp_path, **kwargs):
+    flow = OrchestratorFlow(store=EvidenceStore(str(tmp_path / "evidence.db")))
+    flow.runs_dir = str(tmp_path / "runs")
+    return WatchEngine(flow=flow, window=5, reports_dir=str(tmp_path / "reports"), **kwargs)
+
+def test_price_rule_fires_once_per_episode(tmp_path, caplog):
+    caplog.set_level("INFO", logger="src.orchestrator.triggers")
+    engine = _engine(tmp_path, cooldown_seconds=0)
+    launched = []
+    for close in [100, 100, 100, 100, 100, 100, 80, 79, 78, 100, 100, 100, 100, 100, 100, 100]:
+        launched += [t.name for t in engine.process(StreamEvent("bar", "TSLA", {"close": close}))]
+    engine._pool.shutdown(wait=True)
+
+    # The spike/drawdown episode launches each crew once while it lasts
+    assert launched.count("drawdown_news_check") == 1
+    assert launched.count("options_liquidity_analysis") == 1
+    # Bars within the episode only check thresholds; no task is built or logged for them
+    assert sum("Volatility spike" in r.getMessage() for r in caplog.records) == 1
+
+    store = engine.flow.store
+    assert store.query(ticker="TSLA", run_id=engine.watch_id)
+
+def test_news_red_flag_respects_cooldown(tmp_path):
+    engine = _engine(tmp_path, cooldown_seconds=3600)
+    article = {"title": "TSLA CEO faces lawsuit over tweets", "snippet": ""}
+    first = engine.process(StreamEvent("news", "TSLA", article))
+    second = engine.process(StreamEvent("news", "TSLA", article))
+    quiet = engine.process(StreamEvent("news", "TSLA", {"title": "TSLA unveils new product line"}))
+    engine._pool.shutdown(wait=True)
+    assert [t.crew for t in first] == ["RegulationLegalCrew"]
+    assert second == [] and quiet == []
+
+def test_watch_run_over_file_and_mock_sources(tmp_path):
+    path = tmp_path / "stream.jsonl"
+    with open(path, "w") as f:
+        for event in MockStreamSource(["AAA", "BBB"], ticks=50, news_probability=0.1, seed=3).events():
+            f.write(json.dumps({"type": event.kind, "ticker": event.ticker, **event.data}) + "\n")
+
+    summary = _engine(tmp_path).run(FileTailSource(str(path), follow=False))
+    assert summary["events"] >= 100 and summary["tickers"] == 2
+    with open(f"{summary['watch_dir']}/events.jsonl") as f:
+        types = [json.loads(line)["type"] for line in f]
+    assert types.count("WATCH_TRIGGER") == summary["tasks_launched"]
+    assert types[-1] == "WATCH_STOPPED"